@@ -0,0 +1,7 @@
+-- Migration: Composite per-user indexes for task queries
+-- Every task tool filters on user_id; these indexes let PostgreSQL read a
+-- single user's rows directly in the order the queries need them, instead of
+-- scanning the user_id index and sorting the result.
+
+-- Task listings: WHERE user_id = ? ORDER BY date_added_gregorian DESC
+CREATE INDEX IF NOT EXISTS idx_tasks_user_date_added ON tasks(user_id, date_added_gregorian DESC);
@@ -0,0 +1,6 @@
+-- Migration: Per-user due date index
+-- Overdue lookups filter on user_id and due_date_gregorian and return rows
+-- ordered by due date; this index serves both the range filter and the order.
+
+-- Overdue tasks: WHERE user_id = ? AND due_date_gregorian < now() ORDER BY due_date_gregorian
+CREATE INDEX IF NOT EXISTS idx_tasks_user_due_date ON tasks(user_id, due_date_gregorian);
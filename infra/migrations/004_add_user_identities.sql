@@ -0,0 +1,9 @@
+-- Migration: External user id registry
+-- The agent maps external user identifiers to UUIDs. Keeping the mapping in
+-- the database makes it durable and shared by every worker process.
+
+CREATE TABLE IF NOT EXISTS user_identities (
+    external_id VARCHAR(255) PRIMARY KEY,
+    user_id UUID UNIQUE NOT NULL DEFAULT gen_random_uuid(),
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
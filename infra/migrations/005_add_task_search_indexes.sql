@@ -0,0 +1,10 @@
+-- Migration: Trigram indexes for task search
+-- search_tasks matches name/description with ILIKE '%term%', which a btree
+-- index cannot serve. pg_trgm GIN indexes let PostgreSQL answer these
+-- substring matches with an index scan instead of reading every row.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Task search: WHERE user_id = ? AND (name ILIKE ? OR description ILIKE ?)
+CREATE INDEX IF NOT EXISTS idx_tasks_name_trgm ON tasks USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_tasks_description_trgm ON tasks USING gin (description gin_trgm_ops);
@@ -5,6 +5,7 @@ from app.database.database import (
     Base,
     engine,
     SessionLocal,
+    ScopedSession,
     get_db,
     init_db,
     drop_db,
@@ -12,6 +13,7 @@ from app.database.database import (
 )
 from app.database.models import (
     UserModel,
+    UserIdentityModel,
     TaskModel,
     ChatSessionModel,
     ChatMessageModel,
@@ -27,12 +29,14 @@ __all__ = [
     "Base",
     "engine",
     "SessionLocal",
+    "ScopedSession",
     "get_db",
     "init_db",
     "drop_db",
     "reset_db",
     # Models
     "UserModel",
+    "UserIdentityModel",
     "TaskModel",
     "ChatSessionModel",
     "ChatMessageModel",
@@ -5,30 +5,15 @@ Contains the actual logic for various automated processes
 from sqlalchemy.orm import Session
 from datetime import datetime, date, timezone
 from typing import Dict, Any, List
-import os
-
-import pytz
-import jdatetime
 
 from app.database.models import TaskModel, StatusEnum
 from app.database.automated_process_service import AutomatedProcessService
 from app.database.models import ProcessStatusEnum
+from shared.timeutils import APP_TZ, to_jalali_iso
 from shared.logger import get_logger
 
 logger = get_logger(__name__)
 
-# Timezone configuration
-_TIMEZONE = os.getenv("BEHFLOW_TIMEZONE", "Asia/Tehran")
-_TZ = pytz.timezone(_TIMEZONE)
-
-
-def _to_jalali_iso(dt: datetime) -> str:
-    """Convert a timezone-aware Gregorian datetime to a Jalali ISO string."""
-    if dt.tzinfo is None:
-        dt = _TZ.localize(dt)
-    jal = jdatetime.datetime.fromgregorian(datetime=dt.astimezone(_TZ))
-    return jal.strftime("%Y-%m-%dT%H:%M:%S")
-
 
 class RescheduleTasksProcess:
     """
@@ -64,7 +49,7 @@ class RescheduleTasksProcess:
             logger.info("Starting reschedule remaining tasks process")
             
             # Get current date/time in configured timezone
-            now = datetime.now(_TZ)
+            now = datetime.now(APP_TZ)
             today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
             
             # Find all incomplete tasks with due dates before today
@@ -98,7 +83,7 @@ class RescheduleTasksProcess:
                     task.due_date_gregorian = new_due_date
                     
                     # Update Jalali date
-                    task.due_date_jalali = _to_jalali_iso(new_due_date)
+                    task.due_date_jalali = to_jalali_iso(new_due_date)
                     
                     rescheduled_count += 1
                     
@@ -161,7 +146,7 @@ class RescheduleTasksProcess:
             return {
                 "success": False,
                 "error": str(e),
-                "execution_time": datetime.now(_TZ).isoformat()
+                "execution_time": datetime.now(APP_TZ).isoformat()
             }
 
 
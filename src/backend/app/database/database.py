@@ -4,7 +4,7 @@ Database configuration and connection management
 import os
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import sessionmaker, scoped_session, Session
 from typing import Generator
 from shared.logger import get_logger
 
@@ -19,18 +19,26 @@ DATABASE_URL = os.getenv(
 # For SQLite (development)
 # DATABASE_URL = "sqlite:///./behflow.db"
 
-# Create SQLAlchemy engine
+# Create SQLAlchemy engine (one per process; sessions borrow pooled connections)
 engine = create_engine(
     DATABASE_URL,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+    max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "30")),
+    # Reuse the most recently returned connection so idle ones can time out
+    pool_use_lifo=True,
     echo=os.getenv("SQL_ECHO", "false").lower() == "true"
 )
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Thread-local session registry for short-lived callers outside FastAPI
+# dependencies (e.g. agent tools). Call ScopedSession.remove() when done.
+ScopedSession = scoped_session(
+    sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+)
+
 # Create Base class for declarative models
 Base = declarative_base()
 
@@ -1,7 +1,7 @@
 """
 SQLAlchemy database models for Behflow
 """
-from sqlalchemy import Column, String, DateTime, Text, Enum, ARRAY, ForeignKey, Boolean, Integer, JSON
+from sqlalchemy import Column, String, DateTime, Text, Enum, ARRAY, ForeignKey, Boolean, Integer, JSON, Index, DDL, event
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
@@ -65,6 +65,18 @@ class UserModel(Base):
         return f"<User(user_id={self.user_id}, username={self.username})>"
 
 
+class UserIdentityModel(Base):
+    """Maps external user identifiers (auth subjects, usernames) to stable UUIDs"""
+    __tablename__ = "user_identities"
+
+    external_id = Column(String(255), primary_key=True)
+    user_id = Column(PG_UUID(as_uuid=True), unique=True, nullable=False, default=uuid.uuid4)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+
+    def __repr__(self):
+        return f"<UserIdentity(external_id={self.external_id}, user_id={self.user_id})>"
+
+
 class TaskModel(Base):
     """Task database model"""
     __tablename__ = "tasks"
@@ -96,10 +108,27 @@ class TaskModel(Base):
     # Relationships
     user = relationship("UserModel", back_populates="tasks")
 
+    # Query indexes (see infra/migrations/002_*, 003_* and 005_*)
+    __table_args__ = (
+        Index("idx_tasks_user_date_added", user_id, date_added_gregorian.desc()),
+        Index("idx_tasks_user_due_date", user_id, due_date_gregorian),
+        # Trigram indexes serve the ILIKE '%term%' lookups in search_tasks
+        Index("idx_tasks_name_trgm", name, postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        Index("idx_tasks_description_trgm", description, postgresql_using="gin", postgresql_ops={"description": "gin_trgm_ops"}),
+    )
+
     def __repr__(self):
         return f"<Task(task_id={self.task_id}, name={self.name}, status={self.status})>"
 
 
+# gin_trgm_ops (used by the task search indexes) comes from the pg_trgm extension
+event.listen(
+    TaskModel.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
 class ChatSessionModel(Base):
     """Chat session database model"""
     __tablename__ = "chat_sessions"
@@ -2,8 +2,10 @@
 Task service - handles task CRUD operations
 """
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
-from typing import List, Optional
+from sqlalchemy import and_, or_, case, delete, func, update
+from typing import List, Optional, Tuple
+from itertools import groupby
+from operator import itemgetter
 from uuid import UUID
 from datetime import datetime, timezone
 
@@ -17,6 +19,27 @@ logger = get_logger(__name__)
 class TaskService:
     """Service class for task operations"""
     
+    @staticmethod
+    def _to_model(task: Task) -> TaskModel:
+        """Build a TaskModel row from a Task pydantic model"""
+        # Normalize stored datetimes to UTC to avoid timezone inconsistencies
+        date_added_gregorian = task.date_added_gregorian.astimezone(timezone.utc) if task.date_added_gregorian else datetime.now(timezone.utc)
+        due_date_gregorian = task.due_date_gregorian.astimezone(timezone.utc) if task.due_date_gregorian else None
+
+        return TaskModel(
+            task_id=task.task_id,
+            user_id=task.user_id,
+            name=task.name,
+            description=task.description,
+            due_date_gregorian=due_date_gregorian,
+            due_date_jalali=task.due_date_jalali,
+            date_added_gregorian=date_added_gregorian,
+            date_added_jalali=task.date_added_jalali,
+            priority=PriorityEnum[task.priority.upper()],
+            status=StatusEnum[task.status.upper()],
+            tags=task.tags
+        )
+    
     @staticmethod
     def create_task(db: Session, task: Task) -> TaskModel:
         """
@@ -30,23 +53,7 @@ class TaskService:
             Created task model
         """
         try:
-            # Normalize stored datetimes to UTC to avoid timezone inconsistencies
-            date_added_gregorian = task.date_added_gregorian.astimezone(timezone.utc) if task.date_added_gregorian else datetime.now(timezone.utc)
-            due_date_gregorian = task.due_date_gregorian.astimezone(timezone.utc) if task.due_date_gregorian else None
-
-            db_task = TaskModel(
-                task_id=task.task_id,
-                user_id=task.user_id,
-                name=task.name,
-                description=task.description,
-                due_date_gregorian=due_date_gregorian,
-                due_date_jalali=task.due_date_jalali,
-                date_added_gregorian=date_added_gregorian,
-                date_added_jalali=task.date_added_jalali,
-                priority=PriorityEnum[task.priority.upper()],
-                status=StatusEnum[task.status.upper()],
-                tags=task.tags
-            )
+            db_task = TaskService._to_model(task)
             
             db.add(db_task)
             db.commit()
@@ -61,18 +68,50 @@ class TaskService:
             raise
     
     @staticmethod
-    def get_task_by_id(db: Session, task_id: UUID) -> Optional[TaskModel]:
+    def bulk_create(db: Session, tasks: List[Task]) -> List[TaskModel]:
+        """
+        Create several tasks in one flush
+        
+        The rows are added together, so SQLAlchemy batches them into a single
+        multi-row INSERT instead of one round trip per task.
+        
+        Args:
+            db: Database session
+            tasks: Task pydantic models
+            
+        Returns:
+            Created task models, in input order
+        """
+        try:
+            db_tasks = [TaskService._to_model(task) for task in tasks]
+            db.add_all(db_tasks)
+            db.commit()
+            
+            logger.info(f"Created {len(db_tasks)} tasks")
+            return db_tasks
+            
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error creating tasks: {e}")
+            raise
+    
+    @staticmethod
+    def get_task_by_id(db: Session, task_id: UUID, user_id: Optional[UUID] = None) -> Optional[TaskModel]:
         """
         Get task by ID
         
         Args:
             db: Database session
             task_id: Task UUID
+            user_id: Owner UUID (optional); if given, only that user's task matches
             
         Returns:
-            Task model or None if not found
+            Task model or None if not found (or not owned by user_id)
         """
-        return db.query(TaskModel).filter(TaskModel.task_id == task_id).first()
+        query = db.query(TaskModel).filter(TaskModel.task_id == task_id)
+        if user_id is not None:
+            query = query.filter(TaskModel.user_id == user_id)
+        return query.first()
     
     @staticmethod
     def get_user_tasks(
@@ -195,6 +234,174 @@ class TaskService:
             logger.error(f"Error deleting task: {e}")
             return False
     
+    @staticmethod
+    def update_task_for_user(
+        db: Session,
+        task_id: UUID,
+        user_id: UUID,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        due_date_gregorian: Optional[datetime] = None,
+        due_date_jalali: Optional[str] = None,
+        priority: Optional[PriorityEnum] = None,
+        status: Optional[StatusEnum] = None,
+        tags: Optional[List[str]] = None
+    ) -> Optional[TaskModel]:
+        """
+        Update a task owned by a user in a single UPDATE ... RETURNING statement
+        
+        Args:
+            db: Database session
+            task_id: Task UUID
+            user_id: Owner UUID; tasks of other users are left untouched
+            name: New name (optional)
+            description: New description (optional)
+            due_date_gregorian: New due date gregorian (optional)
+            due_date_jalali: New due date jalali (optional)
+            priority: New priority (optional)
+            status: New status (optional)
+            tags: New tags (optional)
+            
+        Returns:
+            Updated task model or None if not found (or not owned by the user)
+        """
+        values = {}
+        if name is not None:
+            values["name"] = name
+        if description is not None:
+            values["description"] = description
+        if due_date_gregorian is not None:
+            values["due_date_gregorian"] = due_date_gregorian
+        if due_date_jalali is not None:
+            values["due_date_jalali"] = due_date_jalali
+        if priority is not None:
+            values["priority"] = priority
+        if status is not None:
+            values["status"] = status
+            # Mark as completed if status is COMPLETED, keeping an earlier timestamp
+            if status == StatusEnum.COMPLETED:
+                values["completed_at"] = func.coalesce(
+                    TaskModel.completed_at, datetime.now(timezone.utc)
+                )
+        if tags is not None:
+            values["tags"] = tags
+        
+        if not values:
+            return TaskService.get_task_by_id(db, task_id, user_id=user_id)
+        
+        try:
+            stmt = (
+                update(TaskModel)
+                .where(TaskModel.task_id == task_id, TaskModel.user_id == user_id)
+                .values(**values)
+                .returning(TaskModel)
+                .execution_options(synchronize_session=False)
+            )
+            task = db.execute(stmt).scalars().first()
+            db.commit()
+            if task:
+                logger.info(f"Task updated: {task.name}")
+            return task
+            
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error updating task: {e}")
+            raise
+    
+    @staticmethod
+    def set_priority(
+        db: Session,
+        task_id: UUID,
+        user_id: UUID,
+        priority: PriorityEnum
+    ) -> Optional[str]:
+        """
+        Set the priority of a task owned by a user in a single statement
+        
+        Args:
+            db: Database session
+            task_id: Task UUID
+            user_id: Owner UUID; tasks of other users are left untouched
+            priority: New priority
+            
+        Returns:
+            Name of the updated task, or None if not found (or not owned by the user)
+        """
+        return TaskService._update_returning_name(db, task_id, user_id, priority=priority)
+    
+    @staticmethod
+    def mark_completed(db: Session, task_id: UUID, user_id: UUID) -> Optional[str]:
+        """
+        Mark a task owned by a user as completed in a single statement
+        
+        Args:
+            db: Database session
+            task_id: Task UUID
+            user_id: Owner UUID; tasks of other users are left untouched
+            
+        Returns:
+            Name of the updated task, or None if not found (or not owned by the user)
+        """
+        return TaskService._update_returning_name(
+            db, task_id, user_id,
+            status=StatusEnum.COMPLETED,
+            completed_at=func.coalesce(TaskModel.completed_at, datetime.now(timezone.utc))
+        )
+    
+    @staticmethod
+    def _update_returning_name(db: Session, task_id: UUID, user_id: UUID, **values) -> Optional[str]:
+        # UPDATE ... WHERE task_id AND user_id RETURNING name: one round trip,
+        # and zero rows means the task is missing or owned by someone else
+        try:
+            stmt = (
+                update(TaskModel)
+                .where(TaskModel.task_id == task_id, TaskModel.user_id == user_id)
+                .values(**values)
+                .returning(TaskModel.name)
+                .execution_options(synchronize_session=False)
+            )
+            name = db.execute(stmt).scalar_one_or_none()
+            db.commit()
+            if name is not None:
+                logger.info(f"Task updated: {name}")
+            return name
+            
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error updating task: {e}")
+            raise
+    
+    @staticmethod
+    def delete_task_for_user(db: Session, task_id: UUID, user_id: UUID) -> Optional[str]:
+        """
+        Delete a task owned by a user in a single DELETE ... RETURNING statement
+        
+        Args:
+            db: Database session
+            task_id: Task UUID
+            user_id: Owner UUID; tasks of other users are left untouched
+            
+        Returns:
+            Name of the deleted task, or None if not found (or not owned by the user)
+        """
+        try:
+            stmt = (
+                delete(TaskModel)
+                .where(TaskModel.task_id == task_id, TaskModel.user_id == user_id)
+                .returning(TaskModel.name)
+                .execution_options(synchronize_session=False)
+            )
+            name = db.execute(stmt).scalar_one_or_none()
+            db.commit()
+            if name is not None:
+                logger.info(f"Task deleted: {task_id}")
+            return name
+            
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error deleting task: {e}")
+            raise
+    
     @staticmethod
     def search_tasks(
         db: Session,
@@ -266,6 +473,67 @@ class TaskService:
             TaskModel.status.in_([StatusEnum.PENDING, StatusEnum.IN_PROGRESS])
         ).order_by(TaskModel.due_date_gregorian).all()
     
+    @staticmethod
+    def grouped_by_priority(
+        db: Session,
+        user_id: UUID,
+        limit: int = 1000
+    ) -> List[Tuple[PriorityEnum, List[Tuple[UUID, str]]]]:
+        """
+        Get task ids and names grouped by priority (high first)
+        
+        Args:
+            db: Database session
+            user_id: User UUID
+            limit: Maximum number of tasks to return
+            
+        Returns:
+            List of (priority, [(task_id, name), ...]) for non-empty groups
+        """
+        order = case(
+            (TaskModel.priority == PriorityEnum.HIGH, 0),
+            (TaskModel.priority == PriorityEnum.MEDIUM, 1),
+            else_=2
+        )
+        return TaskService._grouped(db, user_id, TaskModel.priority, order, limit)
+    
+    @staticmethod
+    def grouped_by_status(
+        db: Session,
+        user_id: UUID,
+        limit: int = 1000
+    ) -> List[Tuple[StatusEnum, List[Tuple[UUID, str]]]]:
+        """
+        Get task ids and names grouped by status (pending first)
+        
+        Args:
+            db: Database session
+            user_id: User UUID
+            limit: Maximum number of tasks to return
+            
+        Returns:
+            List of (status, [(task_id, name), ...]) for non-empty groups
+        """
+        order = case(
+            (TaskModel.status == StatusEnum.PENDING, 0),
+            (TaskModel.status == StatusEnum.IN_PROGRESS, 1),
+            (TaskModel.status == StatusEnum.COMPLETED, 2),
+            else_=3
+        )
+        return TaskService._grouped(db, user_id, TaskModel.status, order, limit)
+    
+    @staticmethod
+    def _grouped(db: Session, user_id: UUID, column, order, limit: int) -> list:
+        # Only the grouping column, id and name go over the wire, already
+        # sorted by group, so grouping is a single pass over adjacent rows
+        rows = db.query(column, TaskModel.task_id, TaskModel.name).filter(
+            TaskModel.user_id == user_id
+        ).order_by(order, TaskModel.name).limit(limit).all()
+        return [
+            (key, [(task_id, name) for _, task_id, name in group])
+            for key, group in groupby(rows, key=itemgetter(0))
+        ]
+    
     @staticmethod
     def get_task_statistics(db: Session, user_id: UUID) -> dict:
         """
@@ -278,28 +546,13 @@ class TaskService:
         Returns:
             Dictionary with task statistics
         """
-        total = db.query(TaskModel).filter(TaskModel.user_id == user_id).count()
-        pending = db.query(TaskModel).filter(
-            TaskModel.user_id == user_id,
-            TaskModel.status == StatusEnum.PENDING
-        ).count()
-        in_progress = db.query(TaskModel).filter(
-            TaskModel.user_id == user_id,
-            TaskModel.status == StatusEnum.IN_PROGRESS
-        ).count()
-        completed = db.query(TaskModel).filter(
-            TaskModel.user_id == user_id,
-            TaskModel.status == StatusEnum.COMPLETED
-        ).count()
-        cancelled = db.query(TaskModel).filter(
-            TaskModel.user_id == user_id,
-            TaskModel.status == StatusEnum.CANCELLED
-        ).count()
+        # One GROUP BY round trip instead of a COUNT query per status
+        rows = db.query(TaskModel.status, func.count()).filter(
+            TaskModel.user_id == user_id
+        ).group_by(TaskModel.status).all()
+        
+        stats = {status.value: 0 for status in StatusEnum}
+        for status, count in rows:
+            stats[status.value] = count
         
-        return {
-            "total": total,
-            "pending": pending,
-            "in_progress": in_progress,
-            "completed": completed,
-            "cancelled": cancelled
-        }
+        return {"total": sum(stats.values()), **stats}
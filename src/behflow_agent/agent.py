@@ -1,6 +1,7 @@
 """
 Main LangGraph agent definition with async support and proper node structure.
 """
+import asyncio
 from typing import Optional
 from langchain_core.messages import HumanMessage
 from langgraph.graph import StateGraph, END
@@ -103,27 +104,27 @@ class BehflowAgent:
             >>> agent = BehflowAgent()
             >>> response = agent.invoke("Create a task to review code", user_id="user123")
         """
-        logger.info(f"Invoking agent with message: {message[:50]}...")
+        logger.info("Invoking agent with message: %.50s...", message)
         
         if not self.compiled_graph:
             logger.error("Graph not compiled")
             return "Error: Graph not compiled"
         
-        # Resolve and set current user context if needed
-        uid_str = None
-        if user_id:
-            from behflow_agent.users import get_or_create_user_uuid
-            uid = get_or_create_user_uuid(user_id)
-            uid_str = str(uid)
-            logger.debug(f"User context set: {uid_str}")
+        try:
+            # Resolve and set current user context if needed
+            uid_str = None
+            if user_id:
+                from behflow_agent.users import get_or_create_user_uuid
+                uid = get_or_create_user_uuid(user_id)
+                uid_str = str(uid)
+                logger.debug("User context set: %s", uid_str)
 
-        # Create initial state
-        initial_state = AgentState(
-            messages=[HumanMessage(content=message)],
-            user_id=uid_str,
-        )
+            # Create initial state
+            initial_state = AgentState(
+                messages=[HumanMessage(content=message)],
+                user_id=uid_str,
+            )
 
-        try:
             # Run the graph
             result = self.compiled_graph.invoke(initial_state)
             
@@ -137,7 +138,7 @@ class BehflowAgent:
             return "No response generated"
             
         except Exception as e:
-            logger.error(f"Error during invocation: {e}", exc_info=True)
+            logger.error("Error during invocation: %s", e, exc_info=True)
             return f"Error: {str(e)}"
     
     async def ainvoke(self, message: str, user_id: Optional[str] = None) -> str:
@@ -158,27 +159,28 @@ class BehflowAgent:
             >>> agent = BehflowAgent()
             >>> response = await agent.ainvoke("List my tasks", user_id="user123")
         """
-        logger.info(f"Async invoking agent with message: {message[:50]}...")
+        logger.info("Async invoking agent with message: %.50s...", message)
         
         if not self.compiled_graph:
             logger.error("Graph not compiled")
             return "Error: Graph not compiled"
         
-        # Resolve and set current user context if needed
-        uid_str = None
-        if user_id:
-            from behflow_agent.users import get_or_create_user_uuid
-            uid = get_or_create_user_uuid(user_id)
-            uid_str = str(uid)
-            logger.debug(f"User context set: {uid_str}")
-        
-        # Create initial state
-        initial_state = AgentState(
-            messages=[HumanMessage(content=message)],
-            user_id=uid_str,
-        )
-        
         try:
+            # Resolve and set current user context if needed; the lookup may
+            # hit the database, so keep it off the event loop
+            uid_str = None
+            if user_id:
+                from behflow_agent.users import get_or_create_user_uuid
+                uid = await asyncio.to_thread(get_or_create_user_uuid, user_id)
+                uid_str = str(uid)
+                logger.debug("User context set: %s", uid_str)
+            
+            # Create initial state
+            initial_state = AgentState(
+                messages=[HumanMessage(content=message)],
+                user_id=uid_str,
+            )
+            
             # Run the graph asynchronously
             result = await self.compiled_graph.ainvoke(initial_state)
             
@@ -192,51 +194,60 @@ class BehflowAgent:
             return "No response generated"
             
         except Exception as e:
-            logger.error(f"Error during async invocation: {e}", exc_info=True)
+            logger.error("Error during async invocation: %s", e, exc_info=True)
             return f"Error: {str(e)}"
     
-    async def astream(self, message: str, user_id: Optional[str] = None):
+    async def astream(
+        self,
+        message: str,
+        user_id: Optional[str] = None,
+        stream_mode: Optional[str] = None,
+    ):
         """
         Async stream the agent responses.
         
         Yields intermediate states as the graph executes, useful for
-        streaming responses in real-time applications.
+        streaming responses in real-time applications. Chunks are forwarded
+        as soon as the graph emits them, without buffering or pacing.
         
         Args:
             message: User input message
             user_id: Optional user identifier
+            stream_mode: LangGraph stream mode. Defaults to per-node state
+                updates; use "messages" to receive LLM token deltas as
+                ``(message_chunk, metadata)`` tuples while they are generated.
             
         Yields:
-            Intermediate state updates from the graph execution
+            Intermediate state updates (or message deltas) from the graph execution
             
         Example:
             >>> async for chunk in agent.astream("Create a task"):
             ...     print(chunk)
         """
-        logger.info(f"Async streaming agent with message: {message[:50]}...")
+        logger.info("Async streaming agent with message: %.50s...", message)
         
         if not self.compiled_graph:
             logger.error("Graph not compiled")
             yield {"error": "Graph not compiled"}
             return
         
-        # Resolve user context
-        uid_str = None
-        if user_id:
-            from behflow_agent.users import get_or_create_user_uuid
-            uid = get_or_create_user_uuid(user_id)
-            uid_str = str(uid)
-        
-        # Create initial state
-        initial_state = AgentState(
-            messages=[HumanMessage(content=message)],
-            user_id=uid_str,
-        )
-        
         try:
+            # Resolve user context (off the event loop, see ainvoke)
+            uid_str = None
+            if user_id:
+                from behflow_agent.users import get_or_create_user_uuid
+                uid = await asyncio.to_thread(get_or_create_user_uuid, user_id)
+                uid_str = str(uid)
+            
+            # Create initial state
+            initial_state = AgentState(
+                messages=[HumanMessage(content=message)],
+                user_id=uid_str,
+            )
+            
             # Stream the graph execution
-            async for chunk in self.compiled_graph.astream(initial_state):
+            async for chunk in self.compiled_graph.astream(initial_state, stream_mode=stream_mode):
                 yield chunk
         except Exception as e:
-            logger.error(f"Error during streaming: {e}", exc_info=True)
+            logger.error("Error during streaming: %s", e, exc_info=True)
             yield {"error": str(e)}
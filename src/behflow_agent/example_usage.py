@@ -72,12 +72,21 @@ async def example_streaming():
     
     agent = BehflowAgent()
     
-    print("Streaming chunks:")
+    print("Streaming tokens:")
+    # "messages" mode forwards LLM token deltas as they arrive instead of
+    # waiting for each node to finish
     async for chunk in agent.astream(
         "What tasks should I prioritize today?",
-        user_id="user123"
+        user_id="user123",
+        stream_mode="messages",
     ):
-        print(f"  Chunk: {chunk}")
+        if isinstance(chunk, dict):
+            print(f"\n  Error: {chunk.get('error')}")
+            continue
+        message_chunk, _metadata = chunk
+        if message_chunk.content:
+            print(message_chunk.content, end="", flush=True)
+    print()
 
 
 async def example_multiple_tools():
@@ -145,5 +154,12 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     # Run the async main function
     asyncio.run(main())
@@ -2,14 +2,36 @@
 LLM configuration and initialization for Behflow agent.
 Supports OpenRouter and other providers via langchain's init_chat_model.
 """
+import hashlib
 import os
-from typing import Optional
+from collections import OrderedDict
+from typing import Optional, Tuple
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain.chat_models import init_chat_model
 from shared.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Chat models hold no per-conversation state, so agents built with identical
+# settings share one instance (and its already-initialized HTTP clients).
+# LRU-bounded; keyed on a digest of the API key, never the key itself.
+_LLM_CACHE_MAX = 16
+_LLM_CACHE: "OrderedDict[Tuple, BaseChatModel]" = OrderedDict()
+
+
+def _key_digest(api_key: Optional[str]) -> Optional[str]:
+    """Return a SHA-256 fingerprint of an API key for use in cache keys."""
+    if api_key is None:
+        return None
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+
+def _cache_llm(cache_key: Tuple, llm: BaseChatModel) -> None:
+    """Store an initialized model, evicting the least recently used one."""
+    _LLM_CACHE[cache_key] = llm
+    if len(_LLM_CACHE) > _LLM_CACHE_MAX:
+        _LLM_CACHE.popitem(last=False)
+
 
 class LLMConfig:
     """Configuration for LLM initialization."""
@@ -51,6 +73,9 @@ def create_llm(config: Optional[LLMConfig] = None) -> BaseChatModel:
     - Automatic client initialization
     - Support for async operations
     
+    Models are cached per configuration, so repeated calls with the same
+    settings return the same, already-initialized instance.
+    
     Args:
         config: LLM configuration object. If None, uses defaults.
         
@@ -65,6 +90,19 @@ def create_llm(config: Optional[LLMConfig] = None) -> BaseChatModel:
     if config is None:
         config = LLMConfig()
     
+    cache_key = (
+        config.model_name,
+        config.temperature,
+        config.max_tokens,
+        _key_digest(config.api_key),
+        config.base_url,
+    )
+    cached = _LLM_CACHE.get(cache_key)
+    if cached is not None:
+        _LLM_CACHE.move_to_end(cache_key)
+        logger.debug("Reusing initialized LLM: %s", config.model_name)
+        return cached
+    
     logger.info(f"Initializing LLM: {config.model_name} (temp={config.temperature})")
     
     # Prepare kwargs for init_chat_model
@@ -91,6 +129,7 @@ def create_llm(config: Optional[LLMConfig] = None) -> BaseChatModel:
                 **kwargs
             )
             logger.info(f"Successfully initialized OpenRouter model: {model_name}")
+            _cache_llm(cache_key, llm)
             return llm
         except Exception as e:
             logger.error(f"Failed to initialize OpenRouter model: {e}")
@@ -103,6 +142,7 @@ def create_llm(config: Optional[LLMConfig] = None) -> BaseChatModel:
                 **kwargs
             )
             logger.info(f"Successfully initialized model: {config.model_name}")
+            _cache_llm(cache_key, llm)
             return llm
         except Exception as e:
             logger.error(f"Failed to initialize model: {e}")
@@ -8,13 +8,25 @@ from typing import Optional, Dict, Any
 from uuid import UUID, uuid4
 from datetime import datetime
 import os
+from types import MappingProxyType
+from zoneinfo import ZoneInfo
 
-import pytz
 from pydantic import BaseModel, Field
 
 # Timezone configuration
 _TIMEZONE = os.getenv("BEHFLOW_TIMEZONE", "Asia/Tehran")
-_TZ = pytz.timezone(_TIMEZONE)
+_TZ = ZoneInfo(_TIMEZONE)
+
+# Reschedule defaults, read once at import (7:30 AM unless overridden by env vars)
+_DEFAULT_SCHEDULE_CONFIG = MappingProxyType({
+    "hour": int(os.getenv("RESCHEDULE_HOUR", "7")),
+    "minute": int(os.getenv("RESCHEDULE_MINUTE", "30")),
+    "timezone": _TIMEZONE,
+})
+_DEFAULT_PROCESS_CONFIG = MappingProxyType({
+    "include_statuses": ("pending", "in_progress"),
+    "update_to_today": True,
+})
 
 
 class TriggerType(str, Enum):
@@ -84,21 +96,14 @@ class RescheduleTasksProcess(AutomatedProcessBase):
     trigger_type: TriggerType = TriggerType.TIME_BASED
     
     def __init__(self, **data):
-        # Set default schedule if not provided
-        if "schedule_config" not in data or data["schedule_config"] is None:
-            # Default to 7:30 AM, but can be overridden by env vars
-            default_hour = int(os.getenv("RESCHEDULE_HOUR", "7"))
-            default_minute = int(os.getenv("RESCHEDULE_MINUTE", "30"))
-            data["schedule_config"] = {
-                "hour": default_hour,
-                "minute": default_minute,
-                "timezone": _TIMEZONE
-            }
+        # Set default schedule if not provided (copied so instances can't mutate the defaults)
+        if data.get("schedule_config") is None:
+            data["schedule_config"] = dict(_DEFAULT_SCHEDULE_CONFIG)
         
         if "process_config" not in data:
-            data["process_config"] = {
-                "include_statuses": ["pending", "in_progress"],
-                "update_to_today": True
-            }
+            data["process_config"] = dict(
+                _DEFAULT_PROCESS_CONFIG,
+                include_statuses=list(_DEFAULT_PROCESS_CONFIG["include_statuses"]),
+            )
         
         super().__init__(**data)
@@ -8,16 +8,10 @@ from enum import Enum
 from typing import List, Optional
 from uuid import UUID, uuid4
 from datetime import datetime
-import os
 
-import pytz
-import jdatetime
 from pydantic import BaseModel, Field, field_validator
 
-# Timezone configuration
-_TIMEZONE = os.getenv("BEHFLOW_TIMEZONE", "Asia/Tehran")
-_TZ = pytz.timezone(_TIMEZONE)
-
+from shared.timeutils import APP_TZ, to_jalali_iso
 
 class Priority(str, Enum):
     LOW = "low"
@@ -32,16 +26,6 @@ class Status(str, Enum):
     CANCELLED = "cancelled"
 
 
-def _to_jalali_iso(dt: datetime) -> str:
-    """Convert a timezone-aware Gregorian datetime to a Jalali ISO string."""
-    # Ensure dt is timezone-aware
-    if dt.tzinfo is None:
-        dt = _TZ.localize(dt)
-    jal = jdatetime.datetime.fromgregorian(datetime=dt.astimezone(_TZ))
-    # Use ISO-like format YYYY-MM-DDTHH:MM:SS
-    return jal.strftime("%Y-%m-%dT%H:%M:%S")
-
-
 class Task(BaseModel):
     """Task model.
 
@@ -68,8 +52,8 @@ class Task(BaseModel):
     due_date_gregorian: Optional[datetime] = None
     due_date_jalali: Optional[str] = None
 
-    date_added_gregorian: datetime = Field(default_factory=lambda: datetime.now(_TZ))
-    date_added_jalali: str = Field(default_factory=lambda: _to_jalali_iso(datetime.now(_TZ)))
+    date_added_gregorian: datetime = Field(default_factory=lambda: datetime.now(APP_TZ))
+    date_added_jalali: str = Field(default_factory=lambda: to_jalali_iso(datetime.now(APP_TZ)))
 
     priority: Priority = Priority.MEDIUM
     tags: Optional[List[str]] = None
@@ -80,16 +64,16 @@ class Task(BaseModel):
         if v is None:
             return v
         if v.tzinfo is None:
-            return _TZ.localize(v)
-        return v.astimezone(_TZ)
+            return v.replace(tzinfo=APP_TZ)
+        return v.astimezone(APP_TZ)
 
     @field_validator("date_added_gregorian", mode="before")
     def _ensure_date_added_tz(cls, v):
         if v is None:
-            return datetime.now(_TZ)
+            return datetime.now(APP_TZ)
         if v.tzinfo is None:
-            return _TZ.localize(v)
-        return v.astimezone(_TZ)
+            return v.replace(tzinfo=APP_TZ)
+        return v.astimezone(APP_TZ)
 
     @field_validator("due_date_jalali", mode="after")
     def _sync_due_jalali(cls, v, info):
@@ -98,7 +82,7 @@ class Task(BaseModel):
             return v
         gd = info.data.get("due_date_gregorian")
         if gd:
-            return _to_jalali_iso(gd)
+            return to_jalali_iso(gd)
         return None
 
     @field_validator("date_added_jalali", mode="after")
@@ -106,11 +90,10 @@ class Task(BaseModel):
         # Compute from date_added_gregorian
         gad = info.data.get("date_added_gregorian")
         if gad:
-            return _to_jalali_iso(gad)
+            return to_jalali_iso(gad)
         return v
 
     class Config:
+        # Datetimes serialize to ISO 8601 natively in pydantic-core; a Python
+        # json_encoders callback would only add a per-field round trip.
         use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
@@ -2,10 +2,13 @@
 Agent nodes for the LangGraph workflow.
 Includes LLM invocation node and tool calling nodes with async support.
 """
-from typing import Dict, Any
-from langchain_core.messages import AIMessage, HumanMessage
+import asyncio
+import logging
+from functools import lru_cache
+from typing import Dict, Any, List
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
 from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+from langchain_core.utils.function_calling import convert_to_openai_tool
 from langgraph.prebuilt import ToolNode
 from behflow_agent.models.models import AgentState
 from behflow_agent.tools import TASK_TOOLS, set_current_user, clear_current_user
@@ -14,6 +17,16 @@ from shared.logger import get_logger
 
 logger = get_logger(__name__)
 
+# TASK_TOOLS is fixed at import time, so the prebuilt ToolNode (which wraps and
+# validates every tool schema) is built once and shared by all tool call nodes
+_TOOL_NODE_SINGLETON = ToolNode(TASK_TOOLS)
+
+
+@lru_cache(maxsize=1)
+def _tools_schema() -> List[Dict[str, Any]]:
+    """Return the OpenAI function schemas for TASK_TOOLS, converted once per process."""
+    return [convert_to_openai_tool(t) for t in TASK_TOOLS]
+
 
 class LLMNode:
     """
@@ -34,9 +47,10 @@ class LLMNode:
             llm: Initialized chat model (from init_chat_model)
         """
         self.llm = llm
-        # Bind tools to the LLM for function calling
-        self.llm_with_tools = llm.bind_tools(TASK_TOOLS)
-        logger.info(f"LLM node initialized with {len(TASK_TOOLS)} tools")
+        # Bind tools to the LLM for function calling (schemas are precomputed,
+        # so binding skips the pydantic introspection of each tool)
+        self.llm_with_tools = llm.bind_tools(_tools_schema())
+        logger.info("LLM node initialized with %d tools", len(TASK_TOOLS))
     
     async def __call__(self, state: AgentState) -> Dict[str, Any]:
         """
@@ -60,45 +74,44 @@ class LLMNode:
         Returns:
             Updated state dict with AI response
         """
-        logger.debug(f"LLM node processing {len(state.messages)} messages")
+        logger.debug("LLM node processing %d messages", len(state.messages))
         
+        token = None
         try:
-            # Set user context for tools
-            if state.user_id:
-                set_current_user(state.user_id)
+            # Set user context for tools (task-local, restored in finally); a
+            # malformed user id is reported like any other node error
+            token = set_current_user(state.user_id)
             
-            # Create prompt template with current time dynamically
-            agent_prompt = ChatPromptTemplate.from_messages([
-                ("system", get_system_prompt()),
-                MessagesPlaceholder(variable_name="messages"),
-            ])
-            
-            # Format messages with prompt template
-            formatted_messages = agent_prompt.format_messages(
-                messages=state.messages
-            )
+            # Prepend the system prompt (with current time) to the history directly;
+            # building and formatting a ChatPromptTemplate per turn would re-parse
+            # the template and copy every message through the placeholder
+            formatted_messages = [SystemMessage(content=get_system_prompt()), *state.messages]
             
             # Invoke LLM with tools bound
             response = await self.llm_with_tools.ainvoke(formatted_messages)
             
-            logger.info(f"LLM responded with {len(response.content) if isinstance(response.content, str) else 'structured'} content")
-            
-            # Check if there are tool calls
-            if hasattr(response, 'tool_calls') and response.tool_calls:
-                logger.info(f"LLM requested {len(response.tool_calls)} tool calls")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "LLM responded with %s content",
+                    len(response.content) if isinstance(response.content, str) else "structured",
+                )
+                # Check if there are tool calls
+                if response.tool_calls:
+                    logger.info("LLM requested %d tool calls", len(response.tool_calls))
             
             return {"messages": [response]}
             
         except Exception as e:
-            logger.error(f"Error in LLM node: {e}", exc_info=True)
+            logger.error("Error in LLM node: %s", e, exc_info=True)
             # Return error message
             error_msg = AIMessage(
                 content=f"I encountered an error: {str(e)}. Please try again."
             )
             return {"messages": [error_msg]}
         finally:
-            # Clear user context
-            clear_current_user()
+            # Restore the previous user context (if it was set)
+            if token is not None:
+                clear_current_user(token)
     
     def invoke(self, state: AgentState) -> Dict[str, Any]:
         """
@@ -110,7 +123,6 @@ class LLMNode:
         Returns:
             Updated state dict with AI response
         """
-        import asyncio
         try:
             loop = asyncio.get_event_loop()
         except RuntimeError:
@@ -132,9 +144,9 @@ class ToolCallNode:
     
     def __init__(self):
         """Initialize the tool call node."""
-        # Use LangGraph's prebuilt ToolNode for tool execution
-        self.tool_node = ToolNode(TASK_TOOLS)
-        logger.info(f"Tool call node initialized with {len(TASK_TOOLS)} tools")
+        # Use LangGraph's prebuilt ToolNode for tool execution (shared instance)
+        self.tool_node = _TOOL_NODE_SINGLETON
+        logger.info("Tool call node initialized with %d tools", len(TASK_TOOLS))
     
     async def __call__(self, state: AgentState) -> Dict[str, Any]:
         """
@@ -160,10 +172,10 @@ class ToolCallNode:
         """
         logger.debug("Tool call node processing tools")
         
+        token = None
         try:
-            # Set user context for tools
-            if state.user_id:
-                set_current_user(state.user_id)
+            # Set user context for tools (task-local, restored in finally)
+            token = set_current_user(state.user_id)
             
             # Execute tools using LangGraph's ToolNode
             # ToolNode automatically extracts tool calls from messages
@@ -173,17 +185,17 @@ class ToolCallNode:
             return result
             
         except Exception as e:
-            logger.error(f"Error in tool call node: {e}", exc_info=True)
+            logger.error("Error in tool call node: %s", e, exc_info=True)
             # Return error message
-            from langchain_core.messages import ToolMessage
             error_msg = ToolMessage(
                 content=f"Tool execution failed: {str(e)}",
                 tool_call_id="error"
             )
             return {"messages": [error_msg]}
         finally:
-            # Clear user context
-            clear_current_user()
+            # Restore the previous user context (if it was set)
+            if token is not None:
+                clear_current_user(token)
     
     def invoke(self, state: AgentState) -> Dict[str, Any]:
         """
@@ -195,7 +207,6 @@ class ToolCallNode:
         Returns:
             Updated state dict with tool results
         """
-        import asyncio
         try:
             loop = asyncio.get_event_loop()
         except RuntimeError:
@@ -205,6 +216,9 @@ class ToolCallNode:
         return loop.run_until_complete(self.ainvoke(state))
 
 
+_TOOL_CALL_NODE = ToolCallNode()
+
+
 def should_continue(state: AgentState) -> str:
     """
     Routing function to determine next node.
@@ -219,8 +233,9 @@ def should_continue(state: AgentState) -> str:
     last_message = messages[-1]
     
     # Check if the last message has tool calls
-    if hasattr(last_message, "tool_calls") and last_message.tool_calls:
-        logger.debug(f"Routing to tools ({len(last_message.tool_calls)} calls)")
+    tool_calls = getattr(last_message, "tool_calls", None)
+    if tool_calls:
+        logger.debug("Routing to tools (%d calls)", len(tool_calls))
         return "tools"
     
     logger.debug("Routing to end")
@@ -244,7 +259,10 @@ def create_tool_node() -> ToolCallNode:
     """
     Factory function to create a tool call node.
     
+    Tool call nodes are stateless wrappers around the shared ToolNode, so
+    every call returns the same module-level instance.
+    
     Returns:
         Configured tool call node
     """
-    return ToolCallNode()
+    return _TOOL_CALL_NODE
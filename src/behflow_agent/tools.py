@@ -2,63 +2,185 @@
 Task management tools for the Behflow agent - Database Integrated Version
 These tools are used by the LangGraph agent to manage tasks via PostgreSQL database
 """
-from typing import List, Optional
+import functools
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
 from uuid import UUID
-from langchain_core.tools import tool
+from langchain_core.tools import BaseTool, tool
 from datetime import datetime, timezone
 from contextlib import contextmanager
+from contextvars import ContextVar, Token
 
 from behflow_agent.models import Task
 from app.database.task_service import TaskService
-from app.database.database import SessionLocal
+from app.database.database import ScopedSession
 from app.database.models import PriorityEnum, StatusEnum
 from shared.logger import get_logger
 
 logger = get_logger(__name__)
 
-# Current user context (set by the agent when invoking tools)
-_CURRENT_USER_ID: str | None = None
-
-
-def set_current_user(user_uuid: str) -> None:
-    """Set the current user UUID (string) for the tool invocation context."""
-    global _CURRENT_USER_ID
-    _CURRENT_USER_ID = user_uuid
-    logger.debug("Set current user to %s", user_uuid)
+# Lowercase value -> enum member, for parsing tool arguments with a plain dict lookup
+_PRIORITY = {e.value: e for e in PriorityEnum}
+_STATUS = {e.value: e for e in StatusEnum}
+
+# Current user context (set by the agent when invoking tools). A ContextVar is
+# task/thread-local, so concurrent agent runs never see each other's user.
+# Holds the parsed UUID so tools don't re-parse the string per call.
+current_user_var: ContextVar[UUID | None] = ContextVar("behflow_current_user", default=None)
+
+# Short-lived per-user cache of read tool output, keyed on (tool, user, args)
+# and holding (time the read started, output). An LRU bounded at
+# _READ_CACHE_MAX entries; expired entries are dropped when they are hit.
+# Mutation tools record the time of the user's last write, and an entry
+# that started before it is stale. The cache is per process and only sees
+# writes made through these tools: a task changed through the REST API or
+# the scheduler can be served stale for up to _READ_CACHE_TTL seconds.
+_READ_CACHE_TTL = 5.0
+_READ_CACHE_MAX = 1024
+_READ_CACHE: "OrderedDict[Tuple[str, UUID, str], Tuple[float, str]]" = OrderedDict()
+_LAST_WRITE: Dict[UUID, float] = {}
+_READ_CACHE_LOCK = threading.Lock()
+
+
+def set_current_user(user_uuid: str | None) -> Token:
+    """Set the current user UUID (string) for the tool invocation context.
+
+    The string is parsed once here. Returns a token that can be passed to
+    ``clear_current_user`` to restore the previous value.
+    """
+    token = current_user_var.set(UUID(user_uuid) if user_uuid else None)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Set current user to %s", user_uuid)
+    return token
 
 
-def clear_current_user() -> None:
-    """Clear the current user context."""
-    global _CURRENT_USER_ID
-    logger.debug("Clearing current user (was: %s)", _CURRENT_USER_ID)
-    _CURRENT_USER_ID = None
+def clear_current_user(token: Token | None = None) -> None:
+    """Clear the current user context, restoring the value saved in `token` if given."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Clearing current user (was: %s)", current_user_var.get())
+    if token is not None:
+        current_user_var.reset(token)
+    else:
+        current_user_var.set(None)
 
 
 def _require_user() -> UUID:
     """Return the current user UUID or raise a ValueError if not set."""
-    if not _CURRENT_USER_ID:
+    uid = current_user_var.get()
+    if uid is None:
         logger.warning("Operation attempted without a current user set")
         raise ValueError("No current user set in agent context")
-    return UUID(_CURRENT_USER_ID)
+    return uid
+
+
+def _parse_task_id(task_id: str) -> UUID | None:
+    """Parse a task ID string, returning None if it is not a valid UUID."""
+    try:
+        return UUID(task_id)
+    except ValueError:
+        return None
+
+
+def _parse_priority(priority: str) -> PriorityEnum:
+    """Map a priority argument to PriorityEnum (raises ValueError if unknown)."""
+    value = _PRIORITY.get(priority.lower())
+    if value is None:
+        raise ValueError(f"Invalid priority: {priority}")
+    return value
+
+
+def _parse_status(status: str) -> StatusEnum:
+    """Map a status argument to StatusEnum (raises ValueError if unknown)."""
+    value = _STATUS.get(status.lower())
+    if value is None:
+        raise ValueError(f"Invalid status: {status}")
+    return value
+
+
+def _parse_iso_date(s: str) -> datetime:
+    """Parse a 'YYYY-MM-DD' string into a UTC datetime (raises ValueError if malformed)."""
+    digits = s[:4] + s[5:7] + s[8:]
+    if len(s) != 10 or s[4] != "-" or s[7] != "-" or not (digits.isascii() and digits.isdigit()):
+        raise ValueError(f"Invalid date: {s}")
+    return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]), tzinfo=timezone.utc)
 
 
 @contextmanager
 def get_db_session():
-    """Context manager for database sessions."""
-    db = SessionLocal()
+    """Context manager for database sessions (thread-scoped, backed by the shared pool).
+
+    Reuses the thread's session if a caller already holds one, and only
+    closes it when this call created it, so nested use never tears down
+    an outer caller's session.
+    """
+    owner = not ScopedSession.registry.has()
+    db = ScopedSession()
     try:
         yield db
     finally:
-        db.close()
+        if owner:
+            # Close the session and hand its connection back to the pool
+            ScopedSession.remove()
+
+
+def _invalidate_reads(uid: UUID) -> None:
+    """Invalidate cached read tool output for `uid` after a write."""
+    now = time.monotonic()
+    with _READ_CACHE_LOCK:
+        _LAST_WRITE[uid] = now
+        # A write older than the TTL can only mark already-expired entries,
+        # so forget those once the table reaches the cache size
+        if len(_LAST_WRITE) > _READ_CACHE_MAX:
+            cutoff = now - _READ_CACHE_TTL
+            for user in [u for u, t in _LAST_WRITE.items() if t < cutoff]:
+                del _LAST_WRITE[user]
+
+
+def _cached_read(func: Callable[..., str]) -> Callable[..., str]:
+    """Cache a read tool's output per user for _READ_CACHE_TTL seconds.
+
+    Error messages are never cached, and calls without a user context fall
+    through so the tool reports the missing user itself. Only use it for
+    tools whose output depends on nothing but the user's tasks (not the clock).
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs) -> str:
+        uid = current_user_var.get()
+        if uid is None:
+            return func(*args, **kwargs)
+        key = (func.__name__, uid, repr((args, sorted(kwargs.items()))))
+        now = time.monotonic()
+        with _READ_CACHE_LOCK:
+            hit = _READ_CACHE.get(key)
+            if hit is not None:
+                started, result = hit
+                if now - started < _READ_CACHE_TTL and started > _LAST_WRITE.get(uid, float("-inf")):
+                    _READ_CACHE.move_to_end(key)
+                    return result
+                del _READ_CACHE[key]
+        result = func(*args, **kwargs)
+        if not result.startswith("Error"):
+            with _READ_CACHE_LOCK:
+                _READ_CACHE[key] = (now, result)
+                if len(_READ_CACHE) > _READ_CACHE_MAX:
+                    _READ_CACHE.popitem(last=False)
+        return result
+    return wrapper
 
 
 def _task_model_to_string(task) -> str:
     """Convert a TaskModel to a formatted string."""
-    due_info = ""
-    if task.due_date_gregorian:
-        due_info = f", Due: {task.due_date_gregorian.strftime('%Y-%m-%d')}"
-    tags_info = f", Tags: {', '.join(task.tags)}" if task.tags else ""
-    return f"[{task.status.value}] {task.name} (Priority: {task.priority.value}, ID: {task.task_id}{due_info}{tags_info})"
+    status = task.status.value
+    priority = task.priority.value
+    due = task.due_date_gregorian
+    tags = task.tags
+    # date().isoformat() yields the same YYYY-MM-DD as strftime without parsing a format
+    due_info = f", Due: {due.date().isoformat()}" if due else ""
+    tags_info = f", Tags: {', '.join(tags)}" if tags else ""
+    return f"[{status}] {task.name} (Priority: {priority}, ID: {task.task_id}{due_info}{tags_info})"
 
 
 @tool
@@ -90,7 +212,7 @@ def add_task(
         due_date_gregorian = None
         if due_date:
             try:
-                due_date_gregorian = datetime.strptime(due_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+                due_date_gregorian = _parse_iso_date(due_date)
             except ValueError:
                 return f"Error: Invalid date format. Use YYYY-MM-DD"
         
@@ -107,9 +229,14 @@ def add_task(
         # Save to database
         with get_db_session() as db:
             db_task = TaskService.create_task(db, task)
+            _invalidate_reads(uid)
             logger.info("Task created in DB: %s for user=%s", db_task.task_id, uid)
             return f"Task '{name}' created successfully with ID: {db_task.task_id}"
             
+    except (ValueError, KeyError) as e:
+        # Expected failures (no user context, invalid input): no traceback needed
+        logger.info("Error creating task: %s", e)
+        return f"Error creating task: {str(e)}"
     except Exception as e:
         logger.exception("Error creating task: %s", e)
         return f"Error creating task: {str(e)}"
@@ -128,29 +255,25 @@ def remove_task(task_id: str) -> str:
     try:
         uid = _require_user()
         logger.info("User %s attempting to remove task %s", uid, task_id)
-        tid = UUID(task_id)
+        tid = _parse_task_id(task_id)
+        if tid is None:
+            return f"Invalid task id: {task_id}"
         
         with get_db_session() as db:
-            # Get the task first to verify ownership
-            task = TaskService.get_task_by_id(db, tid)
+            # Single ownership-checked DELETE: other users' tasks are simply not found
+            name = TaskService.delete_task_for_user(db, tid, uid)
             
-            if not task:
-                logger.warning("Attempted to remove non-existent task %s by user %s", task_id, uid)
+            if name is None:
+                logger.warning("Task %s not found for user %s", task_id, uid)
                 return f"Task {task_id} not found"
-                
-            if task.user_id != uid:
-                logger.warning("User %s attempted to remove task %s which they do not own", uid, task_id)
-                return f"Task {task_id} does not belong to the current user"
-            
-            # Delete the task
-            success = TaskService.delete_task(db, tid)
             
-            if success:
-                logger.info("Task %s removed by user %s", task_id, uid)
-                return f"Task '{task.name}' (ID: {task_id}) removed successfully"
-            else:
-                return f"Failed to remove task {task_id}"
+            _invalidate_reads(uid)
+            logger.info("Task %s removed by user %s", task_id, uid)
+            return f"Task '{name}' (ID: {task_id}) removed successfully"
                 
+    except (ValueError, KeyError) as e:
+        logger.info("Error removing task: %s", e)
+        return f"Error removing task: {str(e)}"
     except Exception as e:
         logger.exception("Error removing task: %s", e)
         return f"Error removing task: {str(e)}"
@@ -181,26 +304,20 @@ def update_task(
     try:
         uid = _require_user()
         logger.info("User %s updating task %s", uid, task_id)
-        tid = UUID(task_id)
+        tid = _parse_task_id(task_id)
+        if tid is None:
+            return f"Invalid task id: {task_id}"
+        
+        # Convert priority and status to enums if provided
+        priority_enum = _parse_priority(priority) if priority else None
+        status_enum = _parse_status(status) if status else None
         
         with get_db_session() as db:
-            # Verify task exists and belongs to user
-            task = TaskService.get_task_by_id(db, tid)
-            
-            if not task:
-                return f"Task {task_id} not found"
-                
-            if task.user_id != uid:
-                return f"Task {task_id} does not belong to the current user"
-            
-            # Convert priority and status to enums if provided
-            priority_enum = PriorityEnum[priority.upper()] if priority else None
-            status_enum = StatusEnum[status.upper()] if status else None
-            
-            # Update the task
-            updated_task = TaskService.update_task(
+            # Single ownership-checked UPDATE: other users' tasks are simply not found
+            updated_task = TaskService.update_task_for_user(
                 db=db,
                 task_id=tid,
+                user_id=uid,
                 name=name,
                 description=description,
                 priority=priority_enum,
@@ -208,20 +325,24 @@ def update_task(
                 tags=tags
             )
             
-            if updated_task:
-                logger.info("Task %s updated by user %s", task_id, uid)
-                changes = []
-                if name: changes.append(f"name to '{name}'")
-                if description: changes.append("description")
-                if priority: changes.append(f"priority to '{priority}'")
-                if status: changes.append(f"status to '{status}'")
-                if tags: changes.append("tags")
-                
-                changes_str = ", ".join(changes) if changes else "properties"
-                return f"Task '{updated_task.name}' updated successfully ({changes_str})"
-            else:
-                return f"Failed to update task {task_id}"
+            if not updated_task:
+                return f"Task {task_id} not found"
+            
+            _invalidate_reads(uid)
+            logger.info("Task %s updated by user %s", task_id, uid)
+            changes = []
+            if name: changes.append(f"name to '{name}'")
+            if description: changes.append("description")
+            if priority: changes.append(f"priority to '{priority}'")
+            if status: changes.append(f"status to '{status}'")
+            if tags: changes.append("tags")
+            
+            changes_str = ", ".join(changes) if changes else "properties"
+            return f"Task '{updated_task.name}' updated successfully ({changes_str})"
                 
+    except (ValueError, KeyError) as e:
+        logger.info("Error updating task: %s", e)
+        return f"Error updating task: {str(e)}"
     except Exception as e:
         logger.exception("Error updating task: %s", e)
         return f"Error updating task: {str(e)}"
@@ -238,7 +359,30 @@ def change_task_priority(task_id: str, priority: str) -> str:
     Returns:
         Success or error message
     """
-    return update_task(task_id=task_id, priority=priority)
+    try:
+        uid = _require_user()
+        logger.info("User %s changing priority of task %s", uid, task_id)
+        tid = _parse_task_id(task_id)
+        if tid is None:
+            return f"Invalid task id: {task_id}"
+        priority_enum = _parse_priority(priority)
+        
+        with get_db_session() as db:
+            name = TaskService.set_priority(db, tid, uid, priority_enum)
+            
+            if name is None:
+                return f"Task {task_id} not found"
+            
+            _invalidate_reads(uid)
+            logger.info("Task %s priority changed by user %s", task_id, uid)
+            return f"Task '{name}' updated successfully (priority to '{priority}')"
+                
+    except (ValueError, KeyError) as e:
+        logger.info("Error updating task: %s", e)
+        return f"Error updating task: {str(e)}"
+    except Exception as e:
+        logger.exception("Error updating task: %s", e)
+        return f"Error updating task: {str(e)}"
 
 
 @tool
@@ -251,10 +395,33 @@ def complete_task(task_id: str) -> str:
     Returns:
         Success or error message
     """
-    return update_task(task_id=task_id, status="completed")
+    try:
+        uid = _require_user()
+        logger.info("User %s completing task %s", uid, task_id)
+        tid = _parse_task_id(task_id)
+        if tid is None:
+            return f"Invalid task id: {task_id}"
+        
+        with get_db_session() as db:
+            name = TaskService.mark_completed(db, tid, uid)
+            
+            if name is None:
+                return f"Task {task_id} not found"
+            
+            _invalidate_reads(uid)
+            logger.info("Task %s completed by user %s", task_id, uid)
+            return f"Task '{name}' updated successfully (status to 'completed')"
+                
+    except (ValueError, KeyError) as e:
+        logger.info("Error updating task: %s", e)
+        return f"Error updating task: {str(e)}"
+    except Exception as e:
+        logger.exception("Error updating task: %s", e)
+        return f"Error updating task: {str(e)}"
 
 
 @tool
+@_cached_read
 def get_all_tasks(status_filter: Optional[str] = None, limit: int = 100) -> str:
     """Get all tasks for the current user.
     
@@ -270,7 +437,7 @@ def get_all_tasks(status_filter: Optional[str] = None, limit: int = 100) -> str:
         logger.info("Retrieving all tasks for user %s", uid)
         
         # Convert status filter to enum if provided
-        status_enum = StatusEnum[status_filter.upper()] if status_filter else None
+        status_enum = _parse_status(status_filter) if status_filter else None
         
         with get_db_session() as db:
             tasks = TaskService.get_user_tasks(
@@ -284,22 +451,24 @@ def get_all_tasks(status_filter: Optional[str] = None, limit: int = 100) -> str:
                 logger.info("No tasks found for user %s", uid)
                 return "No tasks found for current user"
 
-            result = "\n".join([
-                f"- {_task_model_to_string(task)}"
-                for task in tasks
-            ])
-            
-            logger.debug("Found %d tasks for user %s", len(tasks), uid)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Found %d tasks for user %s", len(tasks), uid)
             
             status_info = f" (Status: {status_filter})" if status_filter else ""
-            return f"Tasks for current user{status_info}:\n{result}"
+            parts = [f"Tasks for current user{status_info}:"]
+            parts.extend(f"- {_task_model_to_string(task)}" for task in tasks)
+            return "\n".join(parts)
             
+    except (ValueError, KeyError) as e:
+        logger.info("Error retrieving tasks: %s", e)
+        return f"Error retrieving tasks: {str(e)}"
     except Exception as e:
         logger.exception("Error retrieving tasks: %s", e)
         return f"Error retrieving tasks: {str(e)}"
 
 
 @tool
+@_cached_read
 def search_tasks(search_term: str) -> str:
     """Search for tasks by name or description using a search term.
     
@@ -326,15 +495,17 @@ def search_tasks(search_term: str) -> str:
             if not tasks:
                 return f"No tasks found matching '{search_term}'"
             
-            result = "\n".join([
-                f"- {_task_model_to_string(task)}"
-                + (f"\n  Description: {task.description}" if task.description else "")
-                for task in tasks
-            ])
-            
             logger.info("Found %d matching tasks for user %s", len(tasks), uid)
-            return f"Found {len(tasks)} task(s) matching '{search_term}':\n{result}"
+            parts = [f"Found {len(tasks)} task(s) matching '{search_term}':"]
+            for task in tasks:
+                parts.append(f"- {_task_model_to_string(task)}")
+                if task.description:
+                    parts.append(f"  Description: {task.description}")
+            return "\n".join(parts)
             
+    except (ValueError, KeyError) as e:
+        logger.info("Error searching tasks: %s", e)
+        return f"Error searching tasks: {str(e)}"
     except Exception as e:
         logger.exception("Error searching tasks: %s", e)
         return f"Error searching tasks: {str(e)}"
@@ -359,20 +530,21 @@ def get_overdue_tasks() -> str:
             if not tasks:
                 return "No overdue tasks found. Great job staying on track!"
             
-            result = "\n".join([
-                f"- {_task_model_to_string(task)}"
-                for task in tasks
-            ])
-            
             logger.info("Found %d overdue tasks for user %s", len(tasks), uid)
-            return f"⚠️ You have {len(tasks)} overdue task(s):\n{result}"
+            parts = [f"⚠️ You have {len(tasks)} overdue task(s):"]
+            parts.extend(f"- {_task_model_to_string(task)}" for task in tasks)
+            return "\n".join(parts)
             
+    except (ValueError, KeyError) as e:
+        logger.info("Error retrieving overdue tasks: %s", e)
+        return f"Error retrieving overdue tasks: {str(e)}"
     except Exception as e:
         logger.exception("Error retrieving overdue tasks: %s", e)
         return f"Error retrieving overdue tasks: {str(e)}"
 
 
 @tool
+@_cached_read
 def get_task_statistics() -> str:
     """Get task statistics for the current user.
     
@@ -403,12 +575,16 @@ def get_task_statistics() -> str:
             logger.info("Task statistics retrieved for user %s", uid)
             return result
             
+    except (ValueError, KeyError) as e:
+        logger.info("Error retrieving task statistics: %s", e)
+        return f"Error retrieving task statistics: {str(e)}"
     except Exception as e:
         logger.exception("Error retrieving task statistics: %s", e)
         return f"Error retrieving task statistics: {str(e)}"
 
 
 @tool
+@_cached_read
 def get_tasks_by_tag(tag: str) -> str:
     """Get all tasks with a specific tag for the current user.
     
@@ -428,20 +604,21 @@ def get_tasks_by_tag(tag: str) -> str:
             if not tasks:
                 return f"No tasks found with tag '{tag}'"
             
-            result = "\n".join([
-                f"- {_task_model_to_string(task)}"
-                for task in tasks
-            ])
-            
             logger.info("Found %d tasks with tag '%s' for user %s", len(tasks), tag, uid)
-            return f"Tasks with tag '{tag}' ({len(tasks)}):\n{result}"
+            parts = [f"Tasks with tag '{tag}' ({len(tasks)}):"]
+            parts.extend(f"- {_task_model_to_string(task)}" for task in tasks)
+            return "\n".join(parts)
             
+    except (ValueError, KeyError) as e:
+        logger.info("Error retrieving tasks by tag: %s", e)
+        return f"Error retrieving tasks by tag: {str(e)}"
     except Exception as e:
         logger.exception("Error retrieving tasks by tag: %s", e)
         return f"Error retrieving tasks by tag: {str(e)}"
 
 
 @tool
+@_cached_read
 def group_tasks_by_priority() -> str:
     """Group all tasks by priority for the current user."""
     try:
@@ -449,27 +626,28 @@ def group_tasks_by_priority() -> str:
         logger.info("Grouping tasks by priority for user %s", uid)
         
         with get_db_session() as db:
-            tasks = TaskService.get_user_tasks(db=db, user_id=uid, limit=1000)
-            
-            grouped = {"high": [], "medium": [], "low": []}
-            for task in tasks:
-                grouped[task.priority.value].append(task)
-
-            result = []
-            for priority in ["high", "medium", "low"]:
-                tasks_list = grouped[priority]
-                if tasks_list:
-                    result.append(f"\n{priority.upper()} Priority ({len(tasks_list)}):")
-                    result.extend([f"  - {task.name} (ID: {task.task_id})" for task in tasks_list])
-
-            return "\n".join(result) if result else "No tasks found for current user"
-            
+            # Groups arrive from SQL already ordered high -> medium -> low
+            groups = TaskService.grouped_by_priority(db=db, user_id=uid)
+
+            return "\n".join(
+                line
+                for priority, rows in groups
+                for line in (
+                    f"\n{priority.value.upper()} Priority ({len(rows)}):",
+                    *(f"  - {name} (ID: {task_id})" for task_id, name in rows),
+                )
+            ) or "No tasks found for current user"
+            
+    except (ValueError, KeyError) as e:
+        logger.info("Error grouping tasks by priority: %s", e)
+        return f"Error grouping tasks: {str(e)}"
     except Exception as e:
         logger.exception("Error grouping tasks by priority: %s", e)
         return f"Error grouping tasks: {str(e)}"
 
 
 @tool
+@_cached_read
 def group_tasks_by_status() -> str:
     """Group all tasks by status for the current user."""
     try:
@@ -477,22 +655,21 @@ def group_tasks_by_status() -> str:
         logger.info("Grouping tasks by status for user %s", uid)
         
         with get_db_session() as db:
-            tasks = TaskService.get_user_tasks(db=db, user_id=uid, limit=1000)
-            
-            from collections import defaultdict
-            grouped = defaultdict(list)
-            for task in tasks:
-                grouped[task.status.value].append(task)
-
-            result = []
-            for status in ["pending", "in_progress", "completed", "cancelled"]:
-                tasks_list = grouped.get(status, [])
-                if tasks_list:
-                    result.append(f"\n{status.upper().replace('_', ' ')} ({len(tasks_list)}):")
-                    result.extend([f"  - {task.name} (ID: {task.task_id})" for task in tasks_list])
-
-            return "\n".join(result) if result else "No tasks found for current user"
-            
+            # Groups arrive from SQL already ordered pending -> cancelled
+            groups = TaskService.grouped_by_status(db=db, user_id=uid)
+
+            return "\n".join(
+                line
+                for status, rows in groups
+                for line in (
+                    f"\n{status.value.upper().replace('_', ' ')} ({len(rows)}):",
+                    *(f"  - {name} (ID: {task_id})" for task_id, name in rows),
+                )
+            ) or "No tasks found for current user"
+            
+    except (ValueError, KeyError) as e:
+        logger.info("Error grouping tasks by status: %s", e)
+        return f"Error grouping tasks by status: {str(e)}"
     except Exception as e:
         logger.exception("Error grouping tasks by status: %s", e)
         return f"Error grouping tasks by status: {str(e)}"
@@ -500,8 +677,8 @@ def group_tasks_by_status() -> str:
 
 
 
-# Export all tools as a list for easy binding
-TASK_TOOLS = [
+# Export all tools as an immutable tuple for easy binding
+TASK_TOOLS: Tuple[BaseTool, ...] = (
     add_task,
     remove_task,
     update_task,
@@ -514,5 +691,4 @@ TASK_TOOLS = [
     get_tasks_by_tag,
     group_tasks_by_priority,
     group_tasks_by_status,
-]
-
+)
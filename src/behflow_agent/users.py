@@ -1,15 +1,35 @@
 """
 Simple user mapping service for Behflow.
 Maps external user identifiers (strings) to persistent UUIDs.
-This is an in-memory placeholder for a real user registry or DB table.
+The mapping is stored in the `user_identities` table so it is durable and
+shared by every worker; hot lookups are served from an in-process LRU cache.
+Remove or remap identities through `delete_user_identity` so that cache is
+cleared; rows changed directly in the database are not seen until restart.
 """
+from functools import lru_cache
 from uuid import UUID, uuid4
-from typing import Dict
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from app.database.database import engine
+from app.database.models import UserIdentityModel
 from shared.logger import get_logger
 
 logger = get_logger(__name__)
 
-_USER_MAP: Dict[str, UUID] = {}
+
+@lru_cache(maxsize=4096)
+def _db_get_or_create(external_id: str) -> UUID:
+    """Resolve an external id with a single UPSERT ... RETURNING round trip."""
+    stmt = insert(UserIdentityModel).values(external_id=external_id, user_id=uuid4())
+    # The no-op DO UPDATE makes RETURNING yield the existing row on conflict
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[UserIdentityModel.external_id],
+        set_={"external_id": stmt.excluded.external_id},
+    ).returning(UserIdentityModel.user_id)
+    with engine.begin() as conn:
+        uid = conn.execute(stmt).scalar_one()
+    logger.info("Resolved UUID %s for external_id=%s", uid, external_id)
+    return uid
 
 
 def get_or_create_user_uuid(external_id: str) -> UUID:
@@ -21,14 +41,30 @@ def get_or_create_user_uuid(external_id: str) -> UUID:
     Returns:
         UUID assigned to that external id
     """
-    if external_id in _USER_MAP:
-        logger.debug("Found existing UUID for external_id=%s", external_id)
-        return _USER_MAP[external_id]
-    uid = uuid4()
-    _USER_MAP[external_id] = uid
-    logger.info("Created new UUID %s for external_id=%s", uid, external_id)
-    return uid
+    return _db_get_or_create(external_id)
 
 
 def get_user_uuid(external_id: str) -> UUID | None:
-    return _USER_MAP.get(external_id)
+    stmt = select(UserIdentityModel.user_id).where(UserIdentityModel.external_id == external_id)
+    with engine.connect() as conn:
+        return conn.execute(stmt).scalar_one_or_none()
+
+
+def delete_user_identity(external_id: str) -> bool:
+    """Delete the mapping for an external id and drop cached lookups.
+
+    The next get_or_create_user_uuid call for that id assigns a new UUID.
+
+    Args:
+        external_id: External user id to forget
+
+    Returns:
+        True if a mapping was deleted
+    """
+    stmt = delete(UserIdentityModel).where(UserIdentityModel.external_id == external_id)
+    with engine.begin() as conn:
+        deleted = conn.execute(stmt).rowcount > 0
+    # lru_cache cannot evict a single key; identities are cheap to re-resolve
+    _db_get_or_create.cache_clear()
+    logger.info("Deleted identity for external_id=%s (found=%s)", external_id, deleted)
+    return deleted
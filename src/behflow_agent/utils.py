@@ -4,14 +4,16 @@ Includes prompt templates and helper functions for LLM invocations.
 """
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from datetime import datetime
+from typing import Optional, Tuple
 import os
-import pytz
+import time
+from zoneinfo import ZoneInfo
 import jdatetime
 
 
 # Timezone configuration
 _TIMEZONE = os.getenv("BEHFLOW_TIMEZONE", "Asia/Tehran")
-_TZ = pytz.timezone(_TIMEZONE)
+_TZ = ZoneInfo(_TIMEZONE)
 
 
 def get_current_time_context() -> str:
@@ -33,12 +35,22 @@ def get_current_time_context() -> str:
     return f"Current time: {gregorian_str} (Gregorian) | {jalali_str} (Jalali/Shamsi)"
 
 
+# Last rendered system prompt, keyed by the wall-clock second it was built in
+_PROMPT_CACHE: Optional[Tuple[int, str]] = None
+
+
 # System prompt for the Behflow task management agent
 def get_system_prompt() -> str:
-    """Get system prompt with current time context"""
+    """Get system prompt with current time context (rebuilt at most once per second)"""
+    global _PROMPT_CACHE
+    now_s = int(time.time())
+    cached = _PROMPT_CACHE
+    if cached is not None and cached[0] == now_s:
+        return cached[1]
+    
     time_context = get_current_time_context()
     
-    return f"""You are Behflow, an intelligent task management assistant.
+    prompt = f"""You are Behflow, an intelligent task management assistant.
 
 {time_context}
 
@@ -83,16 +95,21 @@ Available tools include:
 - group_tasks_by_priority: Organize by priority level
 - group_tasks_by_status: Organize by status
 """
+    _PROMPT_CACHE = (now_s, prompt)
+    return prompt
 
 
-# NOTE: create the prompt dynamically per-request so the current time is fresh
+# The template is built once; only the system prompt (with the current time)
+# is bound per request
+_AGENT_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", "{system_prompt}"),
+    MessagesPlaceholder(variable_name="messages"),
+])
+
 
 def get_agent_prompt() -> ChatPromptTemplate:
     """Return a prompt template with the current system prompt (dynamic)."""
-    return ChatPromptTemplate.from_messages([
-        ("system", get_system_prompt()),
-        MessagesPlaceholder(variable_name="messages"),
-    ])
+    return _AGENT_PROMPT.partial(system_prompt=get_system_prompt())
 
 
 # Alternative prompt for more structured responses (keeps using a passed-in system_prompt)
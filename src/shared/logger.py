@@ -1,27 +1,98 @@
 """
 Centralized logger configuration for Behflow
 """
+import atexit
+import copy
+import json
 import logging
 import os
+import queue
 from logging import Logger
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib json encoder
+    orjson = None
+
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()
+
+# Background listener that formats and writes queued records (see configure_logging)
+_listener: Optional[QueueListener] = None
+
+
+def _dumps(obj: dict) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False)
+
+
+class FastFormatter(logging.Formatter):
+    """One-line JSON formatter (LOG_FORMAT=json).
+
+    Emits the raw epoch timestamp instead of a strftime'd asctime, and
+    serializes with orjson when it is installed.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": record.created,
+            "name": record.name,
+            "lvl": record.levelname,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return _dumps(entry)
+
+
+class _LocalQueueHandler(QueueHandler):
+    """QueueHandler for an in-process queue.
+
+    The stock prepare() formats the record up front, folding the traceback
+    into msg and dropping exc_info, so the listener's formatter never sees
+    it (and FastFormatter could not emit it under "exc"). Records here never
+    leave the process, so only the message arguments are merged.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
 
 def configure_logging():
-    """Configure the root logger if not already configured."""
+    """Configure the root logger if not already configured.
+
+    Callers only enqueue records; a background QueueListener thread formats
+    them and writes to the stream, so logging never blocks on stdout I/O.
+    """
+    global _listener
     level = getattr(logging, LOG_LEVEL, logging.INFO)
     root = logging.getLogger()
     if not root.handlers:
         handler = logging.StreamHandler()
-        fmt = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        handler.setFormatter(logging.Formatter(fmt))
-        root.addHandler(handler)
+        if LOG_FORMAT == "json":
+            handler.setFormatter(FastFormatter())
+        else:
+            fmt = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+            handler.setFormatter(logging.Formatter(fmt))
+        log_queue: queue.Queue = queue.Queue(-1)
+        root.addHandler(_LocalQueueHandler(log_queue))
+        _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+        _listener.start()
+        # Flush whatever is still queued on interpreter shutdown
+        atexit.register(_listener.stop)
     root.setLevel(level)
 
 
 def get_logger(name: Optional[str] = None) -> Logger:
     """Return a configured logger instance for `name`."""
     configure_logging()
-    return logging.getLogger(name or "behflow")
\ No newline at end of file
+    return logging.getLogger(name or "behflow")
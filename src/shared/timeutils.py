@@ -0,0 +1,29 @@
+"""
+Timezone and Jalali date helpers shared by the agent and the backend.
+Timezone is read from BEHFLOW_TIMEZONE env var (defaults to Asia/Tehran).
+"""
+import os
+from datetime import datetime
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+import jdatetime
+
+APP_TIMEZONE = os.getenv("BEHFLOW_TIMEZONE", "Asia/Tehran")
+APP_TZ = ZoneInfo(APP_TIMEZONE)
+
+
+@lru_cache(maxsize=4096)
+def _jalali_iso_from_ts(ts: int) -> str:
+    """Convert a POSIX timestamp (whole seconds) to a Jalali ISO string in the service timezone."""
+    jal = jdatetime.datetime.fromgregorian(datetime=datetime.fromtimestamp(ts, APP_TZ))
+    # Use ISO-like format YYYY-MM-DDTHH:MM:SS
+    return jal.strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def to_jalali_iso(dt: datetime) -> str:
+    """Convert a Gregorian datetime (naive means service timezone) to a Jalali ISO string."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=APP_TZ)
+    # The output has second resolution, so drop microseconds to share cache entries
+    return _jalali_iso_from_ts(int(dt.replace(microsecond=0).timestamp()))
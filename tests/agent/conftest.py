@@ -0,0 +1,84 @@
+"""
+Agent test fixtures (the autouse tool-state cleanup only runs for tests
+under tests/agent)
+
+This does not keep backend-only runs free of the agent: the root conftest
+imports app.database, whose task_service imports behflow_agent and with it
+LangChain.
+"""
+from uuid import uuid4
+
+import pytest
+
+# Imported once at conftest load for the autouse cleanup; guarded so a
+# missing agent dependency surfaces in the tests, not as a conftest error
+try:
+    from src.behflow_agent import tools as _agent_tools
+except ImportError:
+    _agent_tools = None
+
+
+@pytest.fixture
+def make_agent_user(engine, test_password_hash):
+    """Return a callable that creates a user and returns its UUID string
+    
+    The agent tools commit through the app's own sessions, outside the
+    per-test transaction, so these users are committed for real and deleted
+    (with their tasks, via ON DELETE CASCADE) after the test.
+    """
+    from sqlalchemy import delete
+    from sqlalchemy.orm import Session
+    from src.backend.app.database.models import UserModel
+    
+    created = []
+    
+    def _make() -> str:
+        with Session(engine, expire_on_commit=False) as session:
+            user = UserModel(
+                username=f"agent-{uuid4().hex[:12]}",
+                password_hash=test_password_hash,
+                name="Agent",
+                lastname="User"
+            )
+            session.add(user)
+            session.commit()
+        created.append(user.user_id)
+        return str(user.user_id)
+    
+    yield _make
+    
+    if created:
+        with engine.begin() as conn:
+            conn.execute(delete(UserModel).where(UserModel.user_id.in_(created)))
+
+
+# Async fixtures for agent testing
+@pytest.fixture
+def agent_user_id(make_agent_user):
+    """UUID string of a fresh user for the agent tools"""
+    return make_agent_user()
+
+
+@pytest.fixture
+def populated_store(agent_user_id, request):
+    """Add the task specs in request.param as the agent test user
+    
+    Use with @pytest.mark.parametrize("populated_store", [[...specs...]], indirect=True).
+    Yields {name: add_task reply}; the current user is left set to agent_user_id.
+    """
+    from src.behflow_agent.tools import add_task, set_current_user
+    
+    set_current_user(agent_user_id)
+    yield {spec["name"]: add_task.invoke(spec) for spec in request.param}
+
+
+@pytest.fixture(autouse=True)
+def cleanup_agent_store():
+    """Reset the agent's per-process tool state after each test"""
+    yield
+    
+    if _agent_tools is None:
+        return
+    _agent_tools.clear_current_user()
+    _agent_tools._READ_CACHE.clear()
+    _agent_tools._LAST_WRITE.clear()
@@ -1,16 +1,52 @@
 """
 Tests for agent tools
 """
+import os
+import re
 import pytest
 from uuid import UUID
 
+# The whole module is skipped when the LLM provider dependency is not installed
+pytest.importorskip("langchain_openai")
+
+from src.behflow_agent.builder import AgentBuilder
+
+_CREATED_RE = re.compile(r"with ID: ([0-9a-f-]{36})")
+_LISTED_RE = re.compile(r"^- \[[a-z_]+\] (.+?) \(Priority: ", re.MULTILINE)
+_FOUND_RE = re.compile(r"Found (\d+) task\(s\)")
+
+
+def _created_id(result: str) -> UUID:
+    """Return the task id from an add_task success message."""
+    match = _CREATED_RE.search(result)
+    assert match, f"no task id in: {result!r}"
+    return UUID(match.group(1))
+
+
+def _listed(result: str) -> list:
+    """Return the task names, in order, from a get_all_tasks listing."""
+    return _LISTED_RE.findall(result)
+
+
+def _parsed(result: str) -> set:
+    """Return the set of task names in a listing, for order-free comparisons."""
+    return set(_LISTED_RE.findall(result))
+
+
+def _found_count(result: str) -> int:
+    """Return N from the "Found N task(s)" header of a search_tasks result."""
+    match = _FOUND_RE.search(result)
+    assert match, f"no task count in: {result!r}"
+    return int(match.group(1))
+
 
 class TestAgentTools:
-    """Test agent task management tools"""
+    """Test agent task management tools (backed by the test database)"""
     
     def test_add_task_tool(self, agent_user_id):
         """Test add_task tool"""
-        from src.behflow_agent.tools import add_task, set_current_user, _TASK_STORE
+        from src.behflow_agent.tools import add_task, set_current_user, get_db_session
+        from src.backend.app.database.task_service import TaskService
         
         set_current_user(agent_user_id)
         
@@ -23,81 +59,90 @@ class TestAgentTools:
         
         assert "created successfully" in result.lower()
         assert "Test Task" in result
-        assert len(_TASK_STORE) == 1
         
         # Verify task properties
-        task = list(_TASK_STORE.values())[0]
-        assert task.name == "Test Task"
-        assert task.description == "Test description"
-        assert task.priority.value == "high"
-        assert "test" in task.tags
-        assert "urgent" in task.tags
+        with get_db_session() as db:
+            task = TaskService.get_task_by_id(db, _created_id(result), user_id=UUID(agent_user_id))
+            assert task is not None
+            assert task.name == "Test Task"
+            assert task.description == "Test description"
+            assert task.priority.value == "high"
+            assert "test" in task.tags
+            assert "urgent" in task.tags
     
     def test_add_task_without_user_context(self):
-        """Test add_task fails without user context"""
+        """Test add_task reports an error without user context"""
         from src.behflow_agent.tools import add_task
         
-        with pytest.raises(ValueError, match="No current user"):
-            add_task.invoke({"name": "Test Task"})
+        result = add_task.invoke({"name": "Test Task"})
+        
+        assert "No current user" in result
     
-    def test_list_tasks_empty(self, agent_user_id):
-        """Test list_tasks with no tasks"""
-        from src.behflow_agent.tools import list_tasks, set_current_user
+    def test_get_all_tasks_empty(self, agent_user_id):
+        """Test get_all_tasks with no tasks"""
+        from src.behflow_agent.tools import get_all_tasks, set_current_user
         
         set_current_user(agent_user_id)
         
-        result = list_tasks.invoke({})
+        result = get_all_tasks.invoke({})
         
         assert "No tasks found" in result
     
-    def test_list_tasks_with_tasks(self, agent_user_id):
-        """Test list_tasks with multiple tasks"""
-        from src.behflow_agent.tools import add_task, list_tasks, set_current_user
-        
-        set_current_user(agent_user_id)
-        
-        # Create tasks
-        add_task.invoke({"name": "Task 1", "priority": "high"})
-        add_task.invoke({"name": "Task 2", "priority": "medium"})
-        add_task.invoke({"name": "Task 3", "priority": "low"})
-        
-        result = list_tasks.invoke({})
-        
-        assert "Found 3 tasks" in result
-        assert "Task 1" in result
-        assert "Task 2" in result
-        assert "Task 3" in result
+    @pytest.mark.parametrize(
+        "populated_store",
+        [[
+            {"name": "Task 1", "priority": "high"},
+            {"name": "Task 2", "priority": "medium"},
+            {"name": "Task 3", "priority": "low"},
+        ]],
+        indirect=True,
+    )
+    def test_get_all_tasks_with_tasks(self, populated_store):
+        """Test get_all_tasks with multiple tasks"""
+        from src.behflow_agent.tools import get_all_tasks
+        
+        result = get_all_tasks.invoke({})
+        
+        assert sorted(_listed(result)) == sorted(populated_store)
     
-    def test_list_tasks_with_status_filter(self, agent_user_id):
-        """Test list_tasks with status filter"""
-        from src.behflow_agent.tools import add_task, list_tasks, set_current_user, _TASK_STORE
-        from src.behflow_agent.models.task import TaskStatus
-        
-        set_current_user(agent_user_id)
+    @pytest.mark.parametrize("populated_store", [[{"name": "Task 1"}, {"name": "Task 2"}]], indirect=True)
+    def test_get_all_tasks_with_status_filter(self, populated_store):
+        """Test get_all_tasks with status filter"""
+        from src.behflow_agent.tools import get_all_tasks, update_task
         
-        # Create tasks with different statuses
-        result1 = add_task.invoke({"name": "Task 1"})
-        result2 = add_task.invoke({"name": "Task 2"})
+        update_task.invoke({"task_id": str(_created_id(populated_store["Task 2"])), "status": "in_progress"})
         
-        # Manually update status for testing
-        tasks = list(_TASK_STORE.values())
-        tasks[0].status = TaskStatus.NOT_STARTED
-        tasks[1].status = TaskStatus.IN_PROGRESS
+        result = get_all_tasks.invoke({"status_filter": "in_progress"})
         
-        result = list_tasks.invoke({"status": "in_progress"})
-        
-        assert "Found 1 tasks" in result or "Found 1 task" in result
-        assert "Task 2" in result
+        assert _listed(result) == ["Task 2"]
+    
+    @pytest.mark.parametrize(
+        "populated_store",
+        [[
+            {"name": "Read book", "description": "Chapter 3"},
+            {"name": "Buy milk"},
+            {"name": "Return library book"},
+        ]],
+        indirect=True,
+    )
+    def test_search_tasks_tool(self, populated_store):
+        """Test search_tasks reports and lists only the matching tasks"""
+        from src.behflow_agent.tools import search_tasks
+        
+        result = search_tasks.invoke({"search_term": "book"})
+        
+        assert _found_count(result) == 2
+        assert sorted(_listed(result)) == ["Read book", "Return library book"]
     
     def test_update_task_tool(self, agent_user_id):
         """Test update_task tool"""
-        from src.behflow_agent.tools import add_task, update_task, set_current_user, _TASK_STORE
+        from src.behflow_agent.tools import add_task, update_task, set_current_user, get_db_session
+        from src.backend.app.database.task_service import TaskService
         
         set_current_user(agent_user_id)
         
         # Create task
-        result = add_task.invoke({"name": "Original Name", "priority": "low"})
-        task_id = list(_TASK_STORE.keys())[0]
+        task_id = _created_id(add_task.invoke({"name": "Original Name", "priority": "low"}))
         
         # Update task
         result = update_task.invoke({
@@ -111,10 +156,11 @@ class TestAgentTools:
         assert "Updated Name" in result
         
         # Verify update
-        task = _TASK_STORE[task_id]
-        assert task.name == "Updated Name"
-        assert task.status.value == "in_progress"
-        assert task.priority.value == "high"
+        with get_db_session() as db:
+            task = TaskService.get_task_by_id(db, task_id, user_id=UUID(agent_user_id))
+            assert task.name == "Updated Name"
+            assert task.status.value == "in_progress"
+            assert task.priority.value == "high"
     
     def test_update_nonexistent_task(self, agent_user_id):
         """Test updating nonexistent task"""
@@ -128,82 +174,81 @@ class TestAgentTools:
         
         assert "not found" in result.lower()
     
-    def test_delete_task_tool(self, agent_user_id):
-        """Test delete_task tool"""
-        from src.behflow_agent.tools import add_task, delete_task, set_current_user, _TASK_STORE
+    def test_remove_task_tool(self, agent_user_id):
+        """Test remove_task tool"""
+        from src.behflow_agent.tools import add_task, remove_task, get_all_tasks, set_current_user
         
         set_current_user(agent_user_id)
         
         # Create task
-        add_task.invoke({"name": "To Delete"})
-        task_id = list(_TASK_STORE.keys())[0]
+        task_id = _created_id(add_task.invoke({"name": "To Delete"}))
+        assert _listed(get_all_tasks.invoke({})) == ["To Delete"]
         
-        assert len(_TASK_STORE) == 1
+        # Remove task
+        result = remove_task.invoke({"task_id": str(task_id)})
         
-        # Delete task
-        result = delete_task.invoke({"task_id": str(task_id)})
-        
-        assert "deleted successfully" in result.lower()
-        assert len(_TASK_STORE) == 0
+        assert "removed successfully" in result.lower()
+        assert "No tasks found" in get_all_tasks.invoke({})
     
-    def test_delete_nonexistent_task(self, agent_user_id):
-        """Test deleting nonexistent task"""
-        from src.behflow_agent.tools import delete_task, set_current_user
+    def test_remove_nonexistent_task(self, agent_user_id):
+        """Test removing nonexistent task"""
+        from src.behflow_agent.tools import remove_task, set_current_user
         from uuid import uuid4
         
         set_current_user(agent_user_id)
         
         fake_id = str(uuid4())
-        result = delete_task.invoke({"task_id": fake_id})
+        result = remove_task.invoke({"task_id": fake_id})
         
         assert "not found" in result.lower()
     
     def test_user_context_management(self):
         """Test user context setting and clearing"""
         from src.behflow_agent.tools import set_current_user, clear_current_user, _require_user
+        from uuid import uuid4
         
         # Should raise without user
         with pytest.raises(ValueError):
             _require_user()
         
         # Set user
-        set_current_user("test-user-123")
+        user_uuid = str(uuid4())
+        set_current_user(user_uuid)
         user_id = _require_user()
-        assert str(user_id) == "test-user-123"
+        assert str(user_id) == user_uuid
         
         # Clear user
         clear_current_user()
         with pytest.raises(ValueError):
             _require_user()
     
-    def test_task_isolation_between_users(self):
+    def test_task_isolation_between_users(self, make_agent_user):
         """Test that tasks are isolated by user"""
-        from src.behflow_agent.tools import add_task, list_tasks, set_current_user, clear_current_user, _TASK_STORE
+        from src.behflow_agent.tools import add_task, get_all_tasks, remove_task, set_current_user, clear_current_user
+        
+        user1, user2 = make_agent_user(), make_agent_user()
         
         # User 1 creates tasks
-        set_current_user("user-1")
-        add_task.invoke({"name": "User 1 Task 1"})
+        set_current_user(user1)
+        user1_task = _created_id(add_task.invoke({"name": "User 1 Task 1"}))
         add_task.invoke({"name": "User 1 Task 2"})
         
-        user1_result = list_tasks.invoke({})
+        user1_result = get_all_tasks.invoke({})
         clear_current_user()
         
-        # User 2 creates tasks
-        set_current_user("user-2")
+        # User 2 creates tasks, and cannot remove user 1's
+        set_current_user(user2)
         add_task.invoke({"name": "User 2 Task 1"})
         
-        user2_result = list_tasks.invoke({})
+        user2_result = get_all_tasks.invoke({})
+        assert "not found" in remove_task.invoke({"task_id": str(user1_task)}).lower()
         clear_current_user()
         
         # User 1 should only see their tasks
-        assert "Found 2 tasks" in user1_result
-        assert "User 1 Task 1" in user1_result
-        assert "User 2 Task 1" not in user1_result
+        assert _parsed(user1_result) == {"User 1 Task 1", "User 1 Task 2"}
         
         # User 2 should only see their task
-        assert "Found 1 task" in user2_result
-        assert "User 2 Task 1" in user2_result
-        assert "User 1 Task 1" not in user2_result
+        assert _parsed(user2_result) == {"User 2 Task 1"}
 
 
 class TestAgentBuilder:
@@ -211,37 +256,42 @@ class TestAgentBuilder:
     
     def test_build_agent_with_defaults(self):
         """Test building agent with default configuration"""
-        from src.behflow_agent.builder import AgentBuilder
+        # The default configuration reads the API key from the environment
+        if not (os.getenv("OPENROUTER_API_KEY") or os.getenv("OPENAI_API_KEY")):
+            pytest.skip("No LLM API key available")
         
         agent = AgentBuilder.build()
         
         assert agent is not None
         # Add more assertions based on your BehflowAgent implementation
     
-    def test_build_agent_with_user_id(self):
-        """Test building agent with specific user ID"""
-        from src.behflow_agent.builder import AgentBuilder
-        
-        user_id = "test-user-123"
-        agent = AgentBuilder.build(user_id=user_id)
+    def test_build_agent_with_config(self):
+        """Test building agent from a config dict
+        
+        The user is not a build option; it is passed to each invoke call.
+        """
+        # Building makes no API calls, so a placeholder key is enough
+        agent = AgentBuilder.build({
+            "model_name": "openai/gpt-4o-mini",
+            "temperature": 0.2,
+            "api_key": "test-key"
+        })
         
         assert agent is not None
-        # Verify user context is set
+        assert agent.compiled_graph is not None
     
     @pytest.mark.asyncio
     async def test_agent_invocation(self):
         """Test agent invocation"""
-        from src.behflow_agent.builder import AgentBuilder
-        
-        agent = AgentBuilder.build(user_id="test-user-123")
-        
         # Simple invocation test
         # Note: This requires LLM API key in environment
         if not os.getenv("OPENAI_API_KEY"):
             pytest.skip("No LLM API key available")
         
+        agent = AgentBuilder.build()
         response = await agent.ainvoke(
-            "Create a task called 'Agent Test Task'"
+            "Create a task called 'Agent Test Task'",
+            user_id="test-user-123"
         )
         
         assert response is not None
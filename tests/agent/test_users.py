@@ -0,0 +1,41 @@
+"""
+Tests for the external id -> UUID user mapping
+"""
+import pytest
+from uuid import uuid4
+
+
+@pytest.fixture
+def external_id(engine):
+    """A fresh external id whose mapping is removed after the test"""
+    from src.behflow_agent.users import delete_user_identity
+    
+    ext_id = f"ext-{uuid4().hex}"
+    yield ext_id
+    delete_user_identity(ext_id)
+
+
+class TestUserMapping:
+    """Test the persistent user mapping and its cache"""
+    
+    def test_get_or_create_is_stable(self, external_id):
+        """Test repeated lookups return the same UUID"""
+        from src.behflow_agent.users import get_or_create_user_uuid, get_user_uuid
+        
+        uid = get_or_create_user_uuid(external_id)
+        
+        assert get_or_create_user_uuid(external_id) == uid
+        assert get_user_uuid(external_id) == uid
+    
+    def test_remap_after_delete(self, external_id):
+        """Test a deleted identity is not served from the cache"""
+        from src.behflow_agent.users import delete_user_identity, get_or_create_user_uuid, get_user_uuid
+        
+        old_uid = get_or_create_user_uuid(external_id)
+        
+        assert delete_user_identity(external_id) is True
+        assert get_user_uuid(external_id) is None
+        
+        new_uid = get_or_create_user_uuid(external_id)
+        assert new_uid != old_uid
+        assert get_user_uuid(external_id) == new_uid
@@ -2,7 +2,7 @@
 Tests for task service
 """
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
 
@@ -55,12 +55,14 @@ class TestTaskService:
     def test_get_user_tasks(self, db_session, sample_user):
         """Test retrieving user tasks"""
         from src.backend.app.database.task_service import TaskService
+        from src.behflow_agent.models.task import Task
         
-        # Create multiple tasks
-        TaskService.create_task(db_session, sample_user.user_id, {"name": "Task 1", "priority": "high"})
-        TaskService.create_task(db_session, sample_user.user_id, {"name": "Task 2", "priority": "medium"})
-        TaskService.create_task(db_session, sample_user.user_id, {"name": "Task 3", "priority": "low"})
-        db_session.commit()
+        # Create multiple tasks in one batch
+        TaskService.bulk_create(db_session, [
+            Task(user_id=sample_user.user_id, name="Task 1", priority="high"),
+            Task(user_id=sample_user.user_id, name="Task 2", priority="medium"),
+            Task(user_id=sample_user.user_id, name="Task 3", priority="low"),
+        ])
         
         # Retrieve all tasks
         tasks = TaskService.get_user_tasks(db_session, sample_user.user_id)
@@ -71,12 +73,14 @@ class TestTaskService:
     def test_get_user_tasks_with_status_filter(self, db_session, sample_user):
         """Test retrieving tasks with status filter"""
         from src.backend.app.database.task_service import TaskService
+        from src.behflow_agent.models.task import Task
         
-        # Create tasks with different statuses
-        TaskService.create_task(db_session, sample_user.user_id, {"name": "Not Started", "status": "not_started"})
-        TaskService.create_task(db_session, sample_user.user_id, {"name": "In Progress", "status": "in_progress"})
-        TaskService.create_task(db_session, sample_user.user_id, {"name": "Completed", "status": "completed"})
-        db_session.commit()
+        # Create tasks with different statuses in one batch
+        TaskService.bulk_create(db_session, [
+            Task(user_id=sample_user.user_id, name="Pending", status="pending"),
+            Task(user_id=sample_user.user_id, name="In Progress", status="in_progress"),
+            Task(user_id=sample_user.user_id, name="Completed", status="completed"),
+        ])
         
         # Filter by status
         in_progress_tasks = TaskService.get_user_tasks(
@@ -91,12 +95,14 @@ class TestTaskService:
     def test_get_user_tasks_with_priority_filter(self, db_session, sample_user):
         """Test retrieving tasks with priority filter"""
         from src.backend.app.database.task_service import TaskService
+        from src.behflow_agent.models.task import Task
         
-        # Create tasks with different priorities
-        TaskService.create_task(db_session, sample_user.user_id, {"name": "Low Priority", "priority": "low"})
-        TaskService.create_task(db_session, sample_user.user_id, {"name": "High Priority 1", "priority": "high"})
-        TaskService.create_task(db_session, sample_user.user_id, {"name": "High Priority 2", "priority": "high"})
-        db_session.commit()
+        # Create tasks with different priorities in one batch
+        TaskService.bulk_create(db_session, [
+            Task(user_id=sample_user.user_id, name="Low Priority", priority="low"),
+            Task(user_id=sample_user.user_id, name="High Priority 1", priority="high"),
+            Task(user_id=sample_user.user_id, name="High Priority 2", priority="high"),
+        ])
         
         # Filter by priority
         high_priority_tasks = TaskService.get_user_tasks(
@@ -176,6 +182,169 @@ class TestTaskService:
         # Should fail
         assert success is False
     
+    def test_update_task_for_user(self, db_session, sample_user, task_factory):
+        """Test single-statement update of an owned task"""
+        from src.backend.app.database.task_service import TaskService
+        from src.backend.app.database.models import PriorityEnum, StatusEnum
+        
+        task_id = task_factory(name="Original", priority=PriorityEnum.LOW)
+        
+        task = TaskService.update_task_for_user(
+            db_session,
+            task_id,
+            sample_user.user_id,
+            name="Renamed",
+            priority=PriorityEnum.HIGH,
+            status=StatusEnum.IN_PROGRESS
+        )
+        
+        assert task is not None
+        assert task.name == "Renamed"
+        assert task.priority == PriorityEnum.HIGH
+        assert task.status == StatusEnum.IN_PROGRESS
+    
+    def test_update_task_for_user_other_owner(self, db_session, other_user, task_factory):
+        """Test update_task_for_user leaves another user's task untouched"""
+        from src.backend.app.database.task_service import TaskService
+        from src.backend.app.database.models import TaskModel
+        
+        task_id = task_factory(name="Mine")
+        
+        result = TaskService.update_task_for_user(
+            db_session, task_id, other_user.user_id, name="Hacked"
+        )
+        
+        assert result is None
+        task = db_session.get(TaskModel, task_id, populate_existing=True)
+        assert task.name == "Mine"
+    
+    def test_delete_task_for_user(self, db_session, sample_user, task_factory):
+        """Test single-statement delete of an owned task"""
+        from src.backend.app.database.task_service import TaskService
+        from src.backend.app.database.models import TaskModel
+        
+        task_id = task_factory(name="To Delete")
+        
+        name = TaskService.delete_task_for_user(db_session, task_id, sample_user.user_id)
+        
+        assert name == "To Delete"
+        assert db_session.get(TaskModel, task_id, populate_existing=True) is None
+    
+    def test_delete_task_for_user_other_owner(self, db_session, other_user, task_factory):
+        """Test delete_task_for_user leaves another user's task in place"""
+        from src.backend.app.database.task_service import TaskService
+        from src.backend.app.database.models import TaskModel
+        
+        task_id = task_factory(name="Mine")
+        
+        name = TaskService.delete_task_for_user(db_session, task_id, other_user.user_id)
+        
+        assert name is None
+        assert db_session.get(TaskModel, task_id, populate_existing=True) is not None
+    
+    def test_set_priority(self, db_session, sample_user, other_user, task_factory):
+        """Test set_priority updates only the owner's task"""
+        from src.backend.app.database.task_service import TaskService
+        from src.backend.app.database.models import PriorityEnum, TaskModel
+        
+        task_id = task_factory(name="Prioritized", priority=PriorityEnum.LOW)
+        
+        assert TaskService.set_priority(db_session, task_id, other_user.user_id, PriorityEnum.HIGH) is None
+        assert TaskService.set_priority(db_session, task_id, sample_user.user_id, PriorityEnum.HIGH) == "Prioritized"
+        
+        task = db_session.get(TaskModel, task_id, populate_existing=True)
+        assert task.priority == PriorityEnum.HIGH
+    
+    def test_mark_completed(self, db_session, sample_user, other_user, task_factory):
+        """Test mark_completed sets status and completed_at for the owner only"""
+        from src.backend.app.database.task_service import TaskService
+        from src.backend.app.database.models import StatusEnum, TaskModel
+        
+        task_id = task_factory(name="Finish Me")
+        
+        assert TaskService.mark_completed(db_session, task_id, other_user.user_id) is None
+        task = db_session.get(TaskModel, task_id, populate_existing=True)
+        assert task.status == StatusEnum.PENDING
+        assert task.completed_at is None
+        
+        assert TaskService.mark_completed(db_session, task_id, sample_user.user_id) == "Finish Me"
+        task = db_session.get(TaskModel, task_id, populate_existing=True)
+        assert task.status == StatusEnum.COMPLETED
+        assert task.completed_at is not None
+    
+    def test_mark_completed_keeps_completed_at(self, db_session, sample_user, task_factory):
+        """Test completing an already completed task keeps the original completed_at"""
+        from src.backend.app.database.task_service import TaskService
+        from src.backend.app.database.models import StatusEnum, TaskModel
+        
+        completed_at = datetime.now(timezone.utc) - timedelta(days=3)
+        task_id = task_factory(status=StatusEnum.COMPLETED, completed_at=completed_at)
+        
+        TaskService.mark_completed(db_session, task_id, sample_user.user_id)
+        TaskService.update_task_for_user(
+            db_session, task_id, sample_user.user_id, status=StatusEnum.COMPLETED
+        )
+        
+        task = db_session.get(TaskModel, task_id, populate_existing=True)
+        assert task.completed_at == completed_at
+    
+    def test_grouped_by_priority(self, db_session, other_user, task_factory):
+        """Test tasks come back grouped high -> low, sorted by name within a group"""
+        from src.backend.app.database.task_service import TaskService
+        from src.backend.app.database.models import PriorityEnum
+        
+        ids = {
+            name: task_factory(user_id=other_user.user_id, name=name, priority=priority)
+            for name, priority in [
+                ("b-low", PriorityEnum.LOW),
+                ("b-high", PriorityEnum.HIGH),
+                ("a-high", PriorityEnum.HIGH),
+                ("a-low", PriorityEnum.LOW),
+            ]
+        }
+        
+        groups = TaskService.grouped_by_priority(db_session, other_user.user_id)
+        
+        assert groups == [
+            (PriorityEnum.HIGH, [(ids["a-high"], "a-high"), (ids["b-high"], "b-high")]),
+            (PriorityEnum.LOW, [(ids["a-low"], "a-low"), (ids["b-low"], "b-low")]),
+        ]
+    
+    def test_grouped_by_status(self, db_session, other_user, task_factory):
+        """Test tasks come back grouped pending -> in progress -> completed"""
+        from src.backend.app.database.task_service import TaskService
+        from src.backend.app.database.models import StatusEnum
+        
+        done = task_factory(user_id=other_user.user_id, name="done", status=StatusEnum.COMPLETED)
+        todo = task_factory(user_id=other_user.user_id, name="todo", status=StatusEnum.PENDING)
+        doing = task_factory(user_id=other_user.user_id, name="doing", status=StatusEnum.IN_PROGRESS)
+        
+        groups = TaskService.grouped_by_status(db_session, other_user.user_id)
+        
+        assert groups == [
+            (StatusEnum.PENDING, [(todo, "todo")]),
+            (StatusEnum.IN_PROGRESS, [(doing, "doing")]),
+            (StatusEnum.COMPLETED, [(done, "done")]),
+        ]
+    
+    def test_get_task_statistics(self, db_session, other_user, task_factory):
+        """Test per-status counts from the GROUP BY, with zeros for missing statuses"""
+        from src.backend.app.database.task_service import TaskService
+        from src.backend.app.database.models import StatusEnum
+        
+        for status in [StatusEnum.PENDING, StatusEnum.PENDING, StatusEnum.COMPLETED]:
+            task_factory(user_id=other_user.user_id, status=status)
+        
+        stats = TaskService.get_task_statistics(db_session, other_user.user_id)
+        
+        assert stats == {
+            "total": 3,
+            "pending": 2,
+            "in_progress": 0,
+            "completed": 1,
+            "cancelled": 0,
+        }
+    
     def test_get_task_by_id(self, db_session, sample_task, sample_user):
         """Test retrieving single task by ID"""
         from src.backend.app.database.task_service import TaskService
@@ -190,25 +359,24 @@ class TestTaskService:
         assert task.task_id == sample_task.task_id
         assert task.name == sample_task.name
     
-    def test_get_overdue_tasks(self, db_session, sample_user):
+    def test_get_overdue_tasks(self, db_session, sample_user, task_factory):
         """Test retrieving overdue tasks"""
         from src.backend.app.database.task_service import TaskService
+        from src.backend.app.database.models import StatusEnum
+        
+        # Capture the clock once; the task and the assertion share it
+        now = datetime.now(timezone.utc)
         
         # Create task with past due date
-        past_date = datetime.now() - timedelta(days=1)
-        TaskService.create_task(
-            db_session,
-            sample_user.user_id,
-            {
-                "name": "Overdue Task",
-                "due_date": past_date.isoformat(),
-                "status": "not_started"
-            }
+        past_date = now - timedelta(days=1)
+        task_factory(
+            name="Overdue Task",
+            due_date_gregorian=past_date,
+            status=StatusEnum.PENDING
         )
-        db_session.commit()
         
         # Get overdue tasks
         overdue_tasks = TaskService.get_overdue_tasks(db_session, sample_user.user_id)
         
         assert len(overdue_tasks) > 0
-        assert all(task.due_date < datetime.now() for task in overdue_tasks if task.due_date)
+        assert all(task.due_date_gregorian < now for task in overdue_tasks if task.due_date_gregorian)